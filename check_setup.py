@@ -5,6 +5,7 @@ import sys
 import subprocess
 from pathlib import Path
 import importlib.util
+import importlib.metadata
 
 def print_header():
     print("=" * 60)
@@ -53,9 +54,10 @@ def check_required_files():
         'assets/vproplayer.ico'
     ]
     
+    # os.path.exists follows the filesystem's own case rules (insensitive on Windows)
     all_exist = True
     for file_path in required_files:
-        if Path(file_path).exists():
+        if os.path.exists(file_path):
             print(f"   ✅ {file_path}")
         else:
             print(f"   ❌ {file_path} - MISSING")
@@ -63,47 +65,46 @@ def check_required_files():
     
     return all_exist
 
+def opencv_distribution():
+    """Name of the installed OpenCV distribution (headless, contrib, ...)"""
+    try:
+        distributions = importlib.metadata.packages_distributions().get('cv2')
+    except AttributeError:  # packages_distributions() is Python 3.10+
+        distributions = None
+    return distributions[0] if distributions else 'opencv-python'
+
 def check_dependencies():
     """Check if all required dependencies are installed"""
     print("📍 Checking Python dependencies...")
     
-    required_packages = [
-        'PyQt6',
-        'cv2',
-        'numpy',
-        'PIL',
-        'moviepy',
-        'imageio',
-        'send2trash',
-        'numba',
-        'psutil'
-    ]
+    # Import name -> (display name, distribution name used for the version)
+    required_packages = {
+        'PyQt6': ('PyQt6', 'PyQt6'),
+        'cv2': ('OpenCV', opencv_distribution()),
+        'numpy': ('numpy', 'numpy'),
+        'PIL': ('Pillow', 'Pillow'),
+        'moviepy': ('moviepy', 'moviepy'),
+        'imageio': ('imageio', 'imageio'),
+        'send2trash': ('send2trash', 'Send2Trash'),
+        'numba': ('numba', 'numba'),
+        'psutil': ('psutil', 'psutil')
+    }
     
     missing_packages = []
-    for package in required_packages:
-        try:
-            # Handle special cases
-            if package == 'cv2':
-                import cv2
-                print(f"   ✅ OpenCV: {cv2.__version__}")
-            elif package == 'PIL':
-                import PIL
-                print(f"   ✅ Pillow: {PIL.__version__}")
-            elif package == 'PyQt6':
-                import PyQt6
-                try:
-                    # Try to get version from PyQt6.QtCore
-                    from PyQt6.QtCore import PYQT_VERSION_STR
-                    print(f"   ✅ PyQt6: {PYQT_VERSION_STR}")
-                except ImportError:
-                    print(f"   ✅ PyQt6: installed (version unknown)")
-            else:
-                module = importlib.import_module(package)
-                version = getattr(module, '__version__', 'unknown')
-                print(f"   ✅ {package}: {version}")
-        except ImportError:
+    for package, (display_name, distribution) in required_packages.items():
+        # find_spec only locates the package - nothing is imported, so we
+        # don't pay for loading Qt/FFmpeg/LLVM just to see that it's there
+        if importlib.util.find_spec(package) is None:
             print(f"   ❌ {package} - NOT INSTALLED")
-            missing_packages.append(package)
+            missing_packages.append(distribution)
+            continue
+            
+        # Read the version from installed metadata instead of module.__version__
+        try:
+            version = importlib.metadata.version(distribution)
+        except importlib.metadata.PackageNotFoundError:
+            version = 'unknown'
+        print(f"   ✅ {display_name}: {version}")
     
     if missing_packages:
         print(f"\n   📦 Install missing packages with:")
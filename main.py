@@ -2,6 +2,7 @@
 
 import sys
 import os
+import logging
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
 
@@ -18,6 +19,10 @@ except ImportError:
 
 def main():
     """Main application entry point"""
+    # Only warnings and errors by default; debug output (per-seek tracing,
+    # slider and key handling) stays off unless the level is lowered
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+    
     app = QApplication(sys.argv)
     
     # Set application properties
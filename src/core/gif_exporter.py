@@ -4,10 +4,20 @@ import cv2
 import numpy as np
 from PIL import Image, ImageSequence
 import os
+import sys
+import logging
+import queue
+import shutil
+import subprocess
 import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6.QtCore import QThread, pyqtSignal
 import time
 
+logger = logging.getLogger(__name__)
+
 # Try to import moviepy, but make it optional
 try:
     from moviepy.editor import VideoFileClip
@@ -17,6 +27,28 @@ except ImportError:
     MOVIEPY_AVAILABLE = False
     print("MoviePy not available - using OpenCV+PIL fallback")
 
+# imageio's GIF writer runs in C and can emit only the changed region per frame
+try:
+    import imageio.v2 as imageio
+    IMAGEIO_AVAILABLE = True
+except ImportError:
+    IMAGEIO_AVAILABLE = False
+
+# imageio-ffmpeg ships a static ffmpeg binary; otherwise look on PATH
+try:
+    import imageio_ffmpeg
+except ImportError:
+    imageio_ffmpeg = None
+
+def find_ffmpeg():
+    """Locate an ffmpeg executable, or return None"""
+    if imageio_ffmpeg is not None:
+        try:
+            return imageio_ffmpeg.get_ffmpeg_exe()
+        except Exception:
+            pass
+    return shutil.which('ffmpeg')
+
 class GifExporter(QThread):
     """Export video segments as GIF files"""
     
@@ -25,6 +57,13 @@ class GifExporter(QThread):
     export_finished = pyqtSignal(str)         # Path to exported GIF
     export_failed = pyqtSignal(str)           # Error message
     
+    # Up to this frame step the fallback exporter reads sequentially and drops
+    # frames; above it, seeking to each kept frame decodes less overall
+    SEQUENTIAL_MAX_FRAME_STEP = 2
+    
+    # Decoded frames allowed to wait for resizing before the decoder blocks
+    DECODE_QUEUE_SIZE = 32
+    
     def __init__(self):
         super().__init__()
         self.video_path = None
@@ -36,6 +75,7 @@ class GifExporter(QThread):
         self.height = 270
         self.quality = 85
         self.cancel_export = False
+        self.last_progress = -1
         
     def setup_export(self, video_path, output_path, start_time, end_time, 
                      fps=10, width=480, height=270, quality=85):
@@ -54,29 +94,126 @@ class GifExporter(QThread):
         """Cancel the current export"""
         self.cancel_export = True
         
+    def _report_progress(self, percent):
+        """Emit progress_updated only when the percentage changes"""
+        # Each emit is a queued cross-thread call into the GUI; per-frame
+        # callers would otherwise send the same value many times over
+        if percent != self.last_progress:
+            self.last_progress = percent
+            self.progress_updated.emit(percent)
+        
     def run(self):
         """Main export thread"""
         try:
-            self.progress_updated.emit(0)
+            self.last_progress = -1
+            self._report_progress(0)
             
-            # Method 1: Using moviepy (recommended for better quality) if available
-            if MOVIEPY_AVAILABLE and self._export_with_moviepy():
-                self.export_finished.emit(self.output_path)
-            else:
-                # Method 2: Using OpenCV + PIL (always available)
+            # Method 1: Single ffmpeg process with a generated palette (fastest, smallest)
+            exported = self._export_with_ffmpeg()
+            
+            # Method 2: Using moviepy if available
+            if not exported and not self.cancel_export and MOVIEPY_AVAILABLE:
+                exported = self._export_with_moviepy()
+                
+            # Method 3: Using OpenCV + PIL (always available)
+            if not exported and not self.cancel_export:
                 self._export_with_opencv()
-                self.export_finished.emit(self.output_path)
+                
+            # Any method may stop (or, for MoviePy, only finish) after a cancel
+            # with a partial GIF written; never leave it or report success
+            if self.cancel_export:
+                self._discard_output()
+                self.export_failed.emit("Export cancelled")
+                return
+                
+            self.export_finished.emit(self.output_path)
                 
         except Exception as e:
             self.export_failed.emit(f"Export failed: {str(e)}")
             
+    def _discard_output(self):
+        """Delete a partially written output file"""
+        try:
+            if self.output_path and os.path.exists(self.output_path):
+                os.remove(self.output_path)
+        except OSError as e:
+            logger.warning("Could not remove partial GIF: %s", e)
+            
+    def _export_with_ffmpeg(self):
+        """Export with one ffmpeg process using palettegen/paletteuse"""
+        ffmpeg = find_ffmpeg()
+        if not ffmpeg:
+            return False
+            
+        # Fewer palette colours for lower quality settings
+        if self.quality >= 95:
+            max_colors = 256
+        elif self.quality >= 85:
+            max_colors = 128
+        else:
+            max_colors = 64
+            
+        filter_graph = (
+            f"fps={self.fps},scale={self.width}:{self.height}:flags=lanczos,"
+            f"split[s0][s1];[s0]palettegen=max_colors={max_colors}[p];[s1][p]paletteuse"
+        )
+        duration = self.end_time - self.start_time
+        command = [
+            ffmpeg, '-y', '-loglevel', 'error',
+            '-ss', str(self.start_time), '-t', str(duration),
+            '-i', self.video_path,
+            '-vf', filter_graph,
+            '-loop', '0',
+            '-progress', 'pipe:1', '-nostats',
+            self.output_path
+        ]
+        
+        # Don't flash a console window from the windowed Windows build
+        creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+        
+        try:
+            process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                creationflags=creationflags
+            )
+            
+            # -progress writes key=value lines; frame=N drives the progress bar
+            total_frames = max(1, int(duration * self.fps))
+            for line in process.stdout:
+                if self.cancel_export:
+                    process.terminate()
+                    break
+                if line.startswith('frame='):
+                    try:
+                        frame = int(line[6:])
+                    except ValueError:
+                        continue
+                    self._report_progress(min(99, int(frame / total_frames * 100)))
+                    
+            _, errors = process.communicate()
+            
+            if process.returncode != 0:
+                if not self.cancel_export:
+                    logger.warning("ffmpeg export failed: %s", errors.strip())
+                return False
+                
+            self._report_progress(100)
+            return True
+            
+        except Exception as e:
+            logger.warning("ffmpeg export failed: %s", e)
+            return False
+            
     def _export_with_moviepy(self):
         """Export using moviepy (better quality) - only if available"""
         if not MOVIEPY_AVAILABLE:
             return False
             
         try:
-            self.progress_updated.emit(10)
+            self._report_progress(10)
             
             # Load video clip
             clip = VideoFileClip(self.video_path)
@@ -84,18 +221,18 @@ class GifExporter(QThread):
             # Extract subclip
             subclip = clip.subclip(self.start_time, self.end_time)
             
-            self.progress_updated.emit(30)
+            self._report_progress(30)
             
             # Resize if needed
             if self.width and self.height:
                 subclip = subclip.resize((self.width, self.height))
                 
-            self.progress_updated.emit(50)
+            self._report_progress(50)
             
             # Set fps
             subclip = subclip.set_fps(self.fps)
             
-            self.progress_updated.emit(70)
+            self._report_progress(70)
             
             # Export as GIF
             subclip.write_gif(
@@ -105,7 +242,7 @@ class GifExporter(QThread):
                 fuzz=1  # Reduce colors for smaller file size
             )
             
-            self.progress_updated.emit(100)
+            self._report_progress(100)
             
             # Clean up
             subclip.close()
@@ -135,45 +272,111 @@ class GifExporter(QThread):
         # Calculate frame step for target fps
         frame_step = max(1, int(original_fps / self.fps))
         
-        frames = []
-        frame_count = 0
-        total_target_frames = (end_frame - start_frame) // frame_step
+        total_target_frames = max(0, (end_frame - start_frame + frame_step - 1) // frame_step)
         
-        # Seek to start frame
-        cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+        # A small ring of output slots: resize and colour conversion write
+        # straight into a slot, which is reused once its frame has been written
+        ring = np.empty((self.DECODE_QUEUE_SIZE, self.height, self.width, 3), dtype=np.uint8)
         
-        while True:
-            if self.cancel_export:
-                break
-                
-            ret, frame = cap.read()
-            if not ret or cap.get(cv2.CAP_PROP_POS_FRAMES) > end_frame:
-                break
-                
-            # Process every nth frame based on target fps
-            if frame_count % frame_step == 0:
-                # Resize frame
-                frame = cv2.resize(frame, (self.width, self.height))
-                
-                # Convert BGR to RGB
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                
-                # Convert to PIL Image
-                pil_image = Image.fromarray(frame_rgb)
-                frames.append(pil_image)
+        # Decode on one thread while a pool resizes/converts into the ring;
+        # OpenCV releases the GIL, so the conversions run truly in parallel
+        frame_queue = queue.Queue(maxsize=self.DECODE_QUEUE_SIZE)
+        decode_errors = []
+        stop_decoding = threading.Event()
+        decoder = threading.Thread(
+            target=self._decode_frames,
+            args=(cap, start_frame, end_frame, frame_step, total_target_frames, frame_queue, decode_errors, stop_decoding),
+            daemon=True
+        )
+        decoder.start()
+        
+        writer = self._open_gif_writer()
+        pil_frames = []  # Only used when no streaming writer is available
+        frames_written = 0
+        pending = deque()  # (slot, future) in output order
+        
+        def write_next():
+            nonlocal frames_written
+            slot, future = pending.popleft()
+            future.result()  # Surface any conversion error
+            
+            # Hand over a copy so the slot can be reused: with subrectangles the
+            # writer keeps the last frame to diff the next one against
+            if writer is not None:
+                writer.append_data(ring[slot].copy())
+            else:
+                pil_frames.append(Image.fromarray(ring[slot].copy()))
                 
-                # Update progress
-                progress = int((len(frames) / total_target_frames) * 90)
-                self.progress_updated.emit(progress)
+            frames_written += 1
+            self._report_progress(int((frames_written / total_target_frames) * 95))
+        
+        workers = max(1, (os.cpu_count() or 2) - 1)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                while True:
+                    item = frame_queue.get()
+                    if item is None:
+                        break
+                        
+                    index, frame = item
+                    
+                    # Every slot is busy: wait for the oldest frame and write it
+                    if len(pending) == len(ring):
+                        write_next()
+                        
+                    slot = index % len(ring)
+                    pending.append((slot, pool.submit(self._convert_frame, frame, ring[slot])))
+                    
+                    # Write whatever has already finished, in order
+                    while pending and pending[0][1].done():
+                        write_next()
+                        
+                while pending:
+                    write_next()
+        finally:
+            if writer is not None:
+                writer.close()
                 
-            frame_count += 1
-            
-        cap.release()
+            # If writing failed part way, stop the decoder and unblock its put()
+            stop_decoding.set()
+            while decoder.is_alive():
+                try:
+                    frame_queue.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            decoder.join()
+            cap.release()
         
-        if not frames:
+        if decode_errors:
+            raise decode_errors[0]
+            
+        if not frames_written:
             raise Exception("No frames extracted")
             
-        # Save as GIF
+        if writer is None:
+            self._save_gif_pil(pil_frames)
+        
+        self._report_progress(100)
+        
+    def _open_gif_writer(self):
+        """Open a streaming imageio GIF writer, or return None to fall back to PIL"""
+        if IMAGEIO_AVAILABLE:
+            try:
+                # subrectangles stores only the changed bounding box per frame
+                return imageio.get_writer(
+                    self.output_path,
+                    format='GIF-PIL',
+                    mode='I',
+                    fps=self.fps,
+                    loop=0,
+                    subrectangles=True
+                )
+            except Exception as e:
+                logger.warning("imageio GIF writer unavailable, falling back to PIL: %s", e)
+        return None
+        
+    def _save_gif_pil(self, frames):
+        """Write PIL frames to the output GIF in one go"""
         frames[0].save(
             self.output_path,
             save_all=True,
@@ -184,7 +387,61 @@ class GifExporter(QThread):
             quality=self.quality
         )
         
-        self.progress_updated.emit(100)
+    def _decode_frames(self, cap, start_frame, end_frame, frame_step, total_target_frames, frame_queue, errors, stop_event):
+        """Decode the kept frames and queue them as (output index, frame) pairs"""
+        try:
+            if frame_step > self.SEQUENTIAL_MAX_FRAME_STEP:
+                # Seek straight to each kept frame so the dropped ones are never decoded
+                for i in range(total_target_frames):
+                    if self.cancel_export or stop_event.is_set():
+                        break
+                        
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame + i * frame_step)
+                    ret, frame = cap.read()
+                    if not ret:
+                        break
+                        
+                    frame_queue.put((i, frame))
+            else:
+                # Small steps: a sequential read is cheaper than a seek per frame
+                cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+                frame_index = start_frame
+                next_keep = start_frame
+                frames_kept = 0
+                
+                while frame_index < end_frame and frames_kept < total_target_frames:
+                    if self.cancel_export or stop_event.is_set():
+                        break
+                        
+                    # Keep every nth frame based on target fps; dropped frames
+                    # are only grab()bed, skipping retrieve()'s conversion and
+                    # the new frame array it allocates
+                    if frame_index != next_keep:
+                        if not cap.grab():
+                            break
+                        frame_index += 1
+                        continue
+                        
+                    ret, frame = cap.read()
+                    if not ret:
+                        break
+                        
+                    frame_queue.put((frames_kept, frame))
+                    frames_kept += 1
+                    next_keep += frame_step
+                    frame_index += 1
+        except Exception as e:
+            errors.append(e)
+        finally:
+            frame_queue.put(None)  # Tell the consumer we're done
+            
+    def _convert_frame(self, frame, out):
+        """Resize a BGR frame to the export size and convert it to RGB in place in out"""
+        # INTER_AREA gives cleaner downscales than the default bilinear filter
+        cv2.resize(frame, (self.width, self.height), dst=out, interpolation=cv2.INTER_AREA)
+        
+        # Convert BGR to RGB in place
+        cv2.cvtColor(out, cv2.COLOR_BGR2RGB, dst=out)
         
     def get_estimated_size(self, video_path, start_time, end_time, fps=10, width=480, height=270):
         """Estimate GIF file size"""
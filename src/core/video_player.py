@@ -2,36 +2,156 @@
 
 import cv2
 import numpy as np
-from PyQt6.QtCore import QThread, pyqtSignal, QTimer, QMutex, QUrl
+from PyQt6.QtCore import QThread, pyqtSignal, QMutex, QWaitCondition, QUrl, QBuffer, QByteArray, QIODevice
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
-from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtGui import QImage, QPixmap, QGuiApplication
 import time
 import os
+import logging
+import tempfile
+import threading
+from bisect import bisect_right
+from collections import OrderedDict, deque
+
+logger = logging.getLogger(__name__)
+
+# OpenCV 4.11+ can read a video straight from memory through IStreamReader
+if hasattr(cv2, 'IStreamReader'):
+    class MemoryStreamReader(cv2.IStreamReader):
+        """Serves an in-memory video to VideoCapture without a temp file"""
+        
+        def __init__(self, data):
+            super().__init__()
+            self.data = data
+            self.position = 0
+            
+        def read(self, buf, size):
+            # seek() may have moved past the end - that's EOF, not a negative read
+            size = max(0, min(size, len(self.data) - self.position))
+            if size == 0:
+                return 0
+            buf[:size] = np.frombuffer(self.data, dtype=np.uint8, count=size, offset=self.position)
+            self.position += size
+            return size
+            
+        def seek(self, offset, origin):
+            if origin == os.SEEK_SET:
+                self.position = offset
+            elif origin == os.SEEK_CUR:
+                self.position += offset
+            elif origin == os.SEEK_END:
+                self.position = len(self.data) + offset
+            return self.position
+else:
+    MemoryStreamReader = None
 
 class VideoPlayerEngine(QThread):
     """Core video playback engine using OpenCV for video + QMediaPlayer for audio"""
     
     # Signals
-    frame_ready = pyqtSignal(np.ndarray)  # Emit frame data
+    frame_ready = pyqtSignal(QImage)      # Emit decoded frame (RGB32 QImage)
     position_changed = pyqtSignal(int)    # Current position in ms
     duration_changed = pyqtSignal(int)    # Total duration in ms
     playback_finished = pyqtSignal()      # Video finished playing
     error_occurred = pyqtSignal(str)      # Error messages
+    seek_completed = pyqtSignal()         # A requested seek was serviced
+    playing_changed = pyqtSignal(bool)    # play() / pause() / stop() was called
+    
+    # Recently shown frames kept for instant back-and-forth scrubbing
+    FRAME_CACHE_SIZE = 64
+    
+    # While scrubbing (inexact seeks) a cached frame this close to the target
+    # is shown instead of decoding the exact one
+    SCRUB_SNAP_SECONDS = 0.25
+    
+    # Frames the decoder thread may get ahead of the one being shown
+    DECODE_AHEAD_FRAMES = 3
+    
+    # Decode slots cycled through by read(): enough for the frames decoded
+    # ahead, the one on screen and a couple still queued to the GUI thread.
+    # This only sizes the pool; a slot still referenced elsewhere is detached
+    # by Qt when written, never overwritten in place
+    FRAME_RING_SIZE = DECODE_AHEAD_FRAMES + 3
+    
+    # Without a keyframe index, seeks at most this far ahead of the decoder
+    # decode forward instead - a seek would restart from the previous keyframe,
+    # which is rarely this close
+    FORWARD_DECODE_MAX_FRAMES = 8
+    
+    # The background keyframe scan checks this often (in packets) whether
+    # another video was loaded, and stops reading the old file if so
+    KEYFRAME_SCAN_CHECK_PACKETS = 256
+    
+    # Playback reports its position to the GUI at most this often (10 Hz);
+    # seeks and pauses always report immediately
+    POSITION_UPDATE_INTERVAL_NS = 100_000_000
+    
+    # Sources opened as network streams rather than files
+    STREAM_PREFIXES = ('rtsp://', 'rtmp://', 'http://', 'https://', 'udp://', 'tcp://')
+    
+    # Environment override for hardware decode: any (default), none, or an
+    # OpenCV acceleration type such as d3d11, vaapi or mfx
+    HW_ACCELERATION_ENV = 'VPRO_HW_ACCELERATION'
+    
+    # Environment override for FFmpeg decode threads; 0 (default) lets FFmpeg
+    # use one per CPU core with frame threading, like PyAV's thread_type AUTO
+    DECODE_THREADS_ENV = 'VPRO_DECODE_THREADS'
     
     def __init__(self):
         super().__init__()
         
         # OpenCV for video (like original)
         self.video_capture = None
+        self.hw_decode = False  # Whether video_capture was opened with hardware decode
         self.is_playing = False
         self.is_paused = False
         self.current_frame = 0
         self.total_frames = 0
         self.fps = 30
         self.frame_duration = 1000 / self.fps  # Duration per frame in ms
+        self.frame_duration_ns = 1_000_000_000 / self.fps  # Same, in ns (float)
+        self.display_frame_step = 1  # Source frames per displayed frame
+        self.play_started_ns = 0  # monotonic_ns() at which frame 0 would have been shown
+        self.audio_clock = None  # (audio position ms, monotonic_ns when reported)
+        self.applied_audio_clock = None  # audio_clock the playback clock was last pinned to
+        self.av_offset_ms = 0  # Positive values show video later relative to audio
         self.video_path = None
-        self.seek_to_frame = -1
+        self.audio_source = None  # Resolved path/URL currently set on media_player
+        self.audio_buffer = None  # QBuffer feeding media_player for in-memory videos
+        self.temp_video_path = None  # Spill file for in-memory videos on older OpenCV
+        self.pending_seek = None  # (frame number, exact) of the latest seek request
+        self.seek_worker_active = False  # A seek thread is servicing pending_seek
+        self.seek_mutex = QMutex()  # One seek decode at a time, in request order
+        self.next_decode_frame = 0  # Frame index the next read() returns
+        self.keyframe_index = None  # Sorted keyframe numbers, once scanned
+        self.frame_cache = OrderedDict()  # frame number -> RGB565 QImage (LRU)
+        self.first_frame_image = None  # Shown again on stop() without decoding
+        self.frame_shape = None  # (height, width, 3) of decoded frames
+        self.frame_width = 0
+        self.frame_height = 0
+        self.bytes_per_line = 0
+        self.decode_scratch = None  # BGR array reused by every read()
+        self.display_size = None  # (width, height) device pixels frames are shown at
+        self.resize_scratch = None  # BGR array frames are downscaled into
+        self.frame_ring = []  # RGB32 QImage slots frames are converted into
+        self.frame_ring_index = 0
+        self.frame_buffer = None  # Slot array the last read() decoded into
+        self.frame_buffer_image = None  # QImage owning frame_buffer's pixels
         self.mutex = QMutex()
+        self.state_changed = QWaitCondition()  # Wakes the playback thread
+        self.capture_mutex = QMutex()  # Serializes decoder access across threads
+        
+        # Decode-ahead channel between the decoder thread and run()
+        self.decoded_frames = deque()  # (frame number, QImage or None at end)
+        self.decode_ready = threading.Condition()
+        self.decode_ahead_frame = -1  # Next frame for the decoder thread (-1 = idle)
+        self.decode_generation = 0  # Bumped on seek so in-flight frames are dropped
+        
+        # Decoder tuning: FFmpeg decode threads (0 = FFmpeg's choice) and frames
+        # to have decoded before playback (re)starts. Small values keep seeks
+        # snappy; larger ones ride out slow frames.
+        self.parallel_frame_count = self.decode_thread_count()
+        self.preroll_frame_count = 2
         
         # QMediaPlayer ONLY for audio
         self.media_player = QMediaPlayer()
@@ -40,25 +160,38 @@ class VideoPlayerEngine(QThread):
         
         # Connect audio player signals
         self.media_player.durationChanged.connect(self.on_audio_duration_changed)
+        self.media_player.positionChanged.connect(self.on_audio_position_changed)
         self.media_player.mediaStatusChanged.connect(self.on_audio_status_changed)
         self.media_player.errorOccurred.connect(self.on_audio_error)
         
     def load_video(self, video_path):
-        """Load a video file"""
+        """Load a video file, network stream URL, or in-memory video (bytes or binary file object)"""
         try:
-            if not os.path.exists(video_path):
-                self.error_occurred.emit(f"File not found: {video_path}")
+            # In-memory videos are decoded straight from the bytes when OpenCV
+            # supports it; otherwise they're written to a temp file once
+            data = None
+            spill_path = None
+            if not isinstance(video_path, str):
+                data = self.read_video_data(video_path)
+                if MemoryStreamReader is None:
+                    video_path = spill_path = self.write_temp_video(data)
+                    data = None
+                    
+            source = data if data is not None else video_path
+            label = video_path if data is None else "in-memory video"
+            is_stream = data is None and self.is_stream_source(video_path)
+            if data is None and not is_stream and not os.path.exists(video_path):
+                self.error_occurred.emit(f"File not found: {label}")
                 return False
                 
-            # Release previous video if any
-            if self.video_capture:
-                self.video_capture.release()
-                
-            # Open new video with OpenCV (like original)
-            self.video_capture = cv2.VideoCapture(video_path)
+            # Release previous video if any and open the new one with OpenCV,
+            # using GPU decode when available
+            self.reopen_capture(source, is_stream)
             
             if not self.video_capture.isOpened():
-                self.error_occurred.emit(f"Cannot open video: {video_path}")
+                self.error_occurred.emit(f"Cannot open video: {label}")
+                if spill_path:
+                    os.remove(spill_path)
                 return False
                 
             # Get video properties
@@ -69,23 +202,71 @@ class VideoPlayerEngine(QThread):
                 self.fps = 30  # Fallback FPS
                 
             self.frame_duration = 1000 / self.fps
+            self.frame_duration_ns = 1_000_000_000 / self.fps
             duration_ms = int((self.total_frames / self.fps) * 1000)
             
-            self.video_path = video_path
+            self.video_path = video_path if data is None else None
             self.current_frame = 0
+            self.next_decode_frame = 0
+            self.keyframe_index = None
+            self.clear_frame_cache()
+            self.first_frame_image = None
+            self.frame_shape = None
+            self.decode_scratch = None
+            self.resize_scratch = None
+            self.frame_ring = []
+            self.frame_buffer = None
+            self.frame_buffer_image = None
             
-            # Load audio separately
-            media_url = QUrl.fromLocalFile(os.path.abspath(video_path))
-            self.media_player.setSource(media_url)
+            # Load audio separately. Re-setting the same source makes some
+            # backends rebuild their whole audio pipeline, so just rewind it.
+            if data is not None:
+                self.audio_buffer = QBuffer()
+                self.audio_buffer.setData(QByteArray(data))
+                self.audio_buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+                self.media_player.setSourceDevice(self.audio_buffer)
+                self.audio_source = None
+            else:
+                audio_source = video_path if is_stream else os.path.realpath(video_path)
+                if audio_source != self.audio_source:
+                    media_url = QUrl(audio_source) if is_stream else QUrl.fromLocalFile(audio_source)
+                    self.media_player.setSource(media_url)
+                    self.audio_source = audio_source
+                    self.audio_buffer = None
+                else:
+                    self.media_player.stop()
             self.audio_output.setVolume(0.7)  # 70% volume
             
+            # Nothing reads an earlier spill file any more
+            if self.temp_video_path and self.temp_video_path != video_path:
+                self.remove_temp_video()
+            if spill_path:
+                self.temp_video_path = spill_path
+            
             # Emit video properties
             self.duration_changed.emit(duration_ms)
             
-            # Load first frame (like original)
-            ret, frame = self.video_capture.read()
-            if ret:
-                self.frame_ready.emit(frame)
+            # Index keyframes in the background so seeks know when decoding
+            # forward beats jumping back to the previous keyframe (a stream
+            # can't be scanned to its end)
+            if data is None and not is_stream:
+                threading.Thread(target=self.scan_keyframes, args=(video_path,), daemon=True).start()
+            
+            # Load first frame (like original) and keep it for stop()
+            self.first_frame_image = self.decode_frame_image(0)
+            if self.first_frame_image is None and self.hw_decode:
+                # Some drivers open a hardware session but can't decode this
+                # stream - fall back to software decoding
+                logger.warning("Hardware decode failed on first frame, using software")
+                self.reopen_capture(source, is_stream, hardware=False)
+                self.next_decode_frame = 0
+                self.first_frame_image = self.decode_frame_image(0)
+                
+            if self.first_frame_image is not None:
+                # Detach from the ring slot, which later reads overwrite
+                self.first_frame_image = self.first_frame_image.copy()
+                self.cache_frame(0, self.first_frame_image)
+                self.frame_ready.emit(self.first_frame_image)
                 
             return True
             
@@ -93,126 +274,583 @@ class VideoPlayerEngine(QThread):
             self.error_occurred.emit(f"Error loading video: {str(e)}")
             return False
     
+    def read_video_data(self, source):
+        """Return the bytes of an in-memory video given as bytes or a binary file object"""
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return bytes(source)
+        return source.read()
+        
+    def write_temp_video(self, data):
+        """Spill an in-memory video to a temp file for OpenCV builds that need a path"""
+        with tempfile.NamedTemporaryFile(prefix='vpro_', suffix='.video', delete=False) as temp_file:
+            temp_file.write(data)
+        return temp_file.name
+        
+    def remove_temp_video(self):
+        """Delete the current spill file, if any"""
+        try:
+            os.remove(self.temp_video_path)
+        except OSError as e:
+            logger.warning("Could not remove temp video %s: %s", self.temp_video_path, e)
+        self.temp_video_path = None
+        
+    def is_stream_source(self, video_path):
+        """True for network stream URLs, which have no file on disk"""
+        return isinstance(video_path, str) and video_path.lower().startswith(self.STREAM_PREFIXES)
+        
+    def reopen_capture(self, video_path, is_stream, hardware=True):
+        """Replace video_capture with a freshly opened one under capture_mutex"""
+        self.capture_mutex.lock()
+        try:
+            if self.video_capture:
+                self.video_capture.release()
+            self.video_capture = self.open_capture(video_path, hardware)
+            
+            # Live sources: keep only the newest frame so reads don't lag
+            # several frames behind the stream
+            if is_stream:
+                self.video_capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        finally:
+            self.capture_mutex.unlock()
+            
+    def hardware_acceleration(self):
+        """OpenCV hardware acceleration type to request, or None for software decode"""
+        if not hasattr(cv2, 'CAP_PROP_HW_ACCELERATION'):
+            return None
+            
+        name = os.environ.get(self.HW_ACCELERATION_ENV, 'any').strip().lower()
+        if name in ('none', 'off', '0'):
+            return None
+            
+        acceleration = getattr(cv2, f'VIDEO_ACCELERATION_{name.upper()}', None)
+        if acceleration is None:
+            logger.warning("Unknown %s value '%s', using any", self.HW_ACCELERATION_ENV, name)
+            acceleration = cv2.VIDEO_ACCELERATION_ANY
+        return acceleration
+        
+    def decode_thread_count(self):
+        """FFmpeg decode thread count from the environment (0 = automatic)"""
+        value = os.environ.get(self.DECODE_THREADS_ENV, '').strip()
+        if not value:
+            return 0
+        try:
+            return max(0, int(value))
+        except ValueError:
+            logger.warning("Invalid %s value '%s', using automatic", self.DECODE_THREADS_ENV, value)
+            return 0
+            
+    def decoder_thread_params(self):
+        """VideoCapture open params requesting parallel_frame_count decode threads
+        
+        Not passing the param keeps OpenCV's default, which already decodes
+        with as many FFmpeg threads as CPU cores.
+        """
+        if self.parallel_frame_count > 0 and hasattr(cv2, 'CAP_PROP_N_THREADS'):
+            return [cv2.CAP_PROP_N_THREADS, self.parallel_frame_count]
+        return []
+        
+    def open_capture(self, video_path, hardware=True):
+        """Open a VideoCapture on a path/URL or in-memory bytes, asking FFmpeg
+        for hardware decode when possible"""
+        thread_params = self.decoder_thread_params()
+        
+        # Each attempt needs its own reader positioned at the start
+        if isinstance(video_path, bytes):
+            data = video_path
+            def capture_source():
+                return MemoryStreamReader(data)
+        else:
+            def capture_source():
+                return video_path
+        
+        # OpenCV 4.5.2+ can decode on DXVA2/D3D11/VAAPI/etc. via open params
+        acceleration = self.hardware_acceleration() if hardware else None
+        if acceleration is not None:
+            try:
+                capture = cv2.VideoCapture(capture_source(), cv2.CAP_FFMPEG, [
+                    cv2.CAP_PROP_HW_ACCELERATION, acceleration
+                ] + thread_params)
+                if capture.isOpened():
+                    self.hw_decode = True
+                    return capture
+                capture.release()
+            except cv2.error as e:
+                logger.warning("Hardware decode unavailable, using software: %s", e)
+                
+        # Software decode fallback (like original)
+        self.hw_decode = False
+        if thread_params or isinstance(video_path, bytes):
+            return cv2.VideoCapture(capture_source(), cv2.CAP_FFMPEG, thread_params)
+        return cv2.VideoCapture(video_path)
+        
+    def scan_keyframes(self, video_path):
+        """Build keyframe_index by demuxing the file once without decoding"""
+        if not hasattr(cv2, 'CAP_PROP_LRF_HAS_KEY_FRAME'):
+            return
+            
+        keyframes = []
+        capture = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG)
+        try:
+            # Raw mode: grab() returns packets, so nothing is decoded
+            if not capture.isOpened() or not capture.set(cv2.CAP_PROP_FORMAT, -1):
+                return
+                
+            frame_number = 0
+            while capture.grab():
+                if frame_number % self.KEYFRAME_SCAN_CHECK_PACKETS == 0 and video_path != self.video_path:
+                    return
+                if capture.get(cv2.CAP_PROP_LRF_HAS_KEY_FRAME):
+                    keyframes.append(frame_number)
+                frame_number += 1
+        except cv2.error as e:
+            logger.debug("Keyframe scan failed: %s", e)
+            return
+        finally:
+            capture.release()
+            
+        # Ignore the result if another video was loaded meanwhile; an empty
+        # scan (no keyframe flags reported) leaves seeks on the default path
+        if keyframes and video_path == self.video_path:
+            self.keyframe_index = keyframes
+            
+    def can_decode_forward_to(self, frame_number):
+        """True if decoding forward from the current position reaches frame_number
+        without passing a keyframe, i.e. a seek could not land any closer"""
+        if not 0 <= self.next_decode_frame < frame_number:
+            return False
+            
+        keyframes = self.keyframe_index
+        if keyframes is None:
+            # Not indexed (yet): only trust short hops, e.g. scrubbing 146, 147, 148
+            return frame_number - self.next_decode_frame <= self.FORWARD_DECODE_MAX_FRAMES
+        return bisect_right(keyframes, frame_number) == bisect_right(keyframes, self.next_decode_frame)
+        
+    def set_frame_geometry(self, frame):
+        """Remember the decoded frame layout so per-frame QImage setup is free"""
+        self.frame_shape = frame.shape
+        self.frame_height, self.frame_width = frame.shape[:2]
+        self.bytes_per_line = frame.strides[0]
+        
+    def allocate_frame_ring(self, height, width):
+        """Preallocate FRAME_RING_SIZE RGB32 QImages for frames to be converted into
+        
+        The pixel memory belongs to Qt, so an emitted slot image stays valid
+        even after the ring is replaced.
+        """
+        # RGB32 is 0xffRRGGBB, i.e. B, G, R, 255 in memory - OpenCV's BGRA
+        self.frame_ring = [QImage(width, height, QImage.Format.Format_RGB32)
+                           for _ in range(self.FRAME_RING_SIZE)]
+        self.frame_ring_index = 0
+        
+    @staticmethod
+    def image_pixels(image, channels, writable=False):
+        """numpy (height, width, channels) uint8 view of a QImage's pixels
+        
+        A writable view calls bits(), which detaches the image first if its
+        data is shared; a read-only view uses constBits() and never copies.
+        """
+        pixels = image.bits() if writable else image.constBits()
+        pixels.setsize(image.sizeInBytes())
+        return np.ndarray((image.height(), image.width(), channels), dtype=np.uint8,
+                          buffer=pixels, strides=(image.bytesPerLine(), channels, 1))
+        
+    def frame_to_qimage(self, frame):
+        """Wrap a decoded BGR frame in a QImage for cross-thread emission
+        
+        Frames in a ring slot come back as that slot's image without copying.
+        Emitted copies share its pixels and stay intact: the next write to the
+        slot detaches it first. Keep a copy() of the returned object itself if
+        it must outlive the next FRAME_RING_SIZE reads.
+        """
+        if frame is self.frame_buffer:
+            return self.frame_buffer_image
+            
+        # Frame size is fixed for a video; only re-derive it if it ever changes
+        if frame.shape != self.frame_shape:
+            self.set_frame_geometry(frame)
+            
+        image = QImage(frame.data, self.frame_width, self.frame_height,
+                       self.bytes_per_line, QImage.Format.Format_BGR888)
+        
+        # Copy so the image owns its pixels; Qt then shares it implicitly
+        return image.copy()
+    
+    def wake_playback_thread(self):
+        """Wake the playback thread so it re-checks play/pause/seek state"""
+        self.mutex.lock()
+        self.state_changed.wakeAll()
+        self.mutex.unlock()
+        self.wake_decoder()
+        
+    def wake_decoder(self):
+        """Wake the decoder thread and any wait for decoded frames"""
+        with self.decode_ready:
+            self.decode_ready.notify_all()
+    
     def play(self):
         """Start video playback"""
         if self.video_capture and self.video_capture.isOpened():
+            self.update_display_frame_step()
+            
+            self.mutex.lock()
             self.is_playing = True
             self.is_paused = False
+            self.state_changed.wakeAll()
+            self.mutex.unlock()
             
             # Start audio
             self.media_player.play()
             
             if not self.isRunning():
                 self.start()
+            self.playing_changed.emit(True)
     
+    def update_display_frame_step(self):
+        """Show only every nth frame when the source frame rate exceeds the screen's"""
+        screen = QGuiApplication.primaryScreen()
+        refresh_hz = screen.refreshRate() if screen else 0
+        if refresh_hz > 0:
+            self.display_frame_step = max(1, int(self.fps / refresh_hz))
+        else:
+            self.display_frame_step = 1
+        
     def pause(self):
         """Pause video playback"""
+        self.mutex.lock()
         self.is_paused = True
+        self.state_changed.wakeAll()
+        self.mutex.unlock()
+        self.audio_clock = None
         self.media_player.pause()
+        self.playing_changed.emit(False)
         
     def stop(self):
         """Stop video playback"""
+        self.mutex.lock()
         self.is_playing = False
         self.is_paused = False
+        self.state_changed.wakeAll()
+        self.mutex.unlock()
+        self.wake_decoder()
         self.current_frame = 0
+        self.restart_decode_ahead(self.current_frame + 1)
         
         # Stop audio
+        self.audio_clock = None
         self.media_player.stop()
+        self.playing_changed.emit(False)
         
-        if self.video_capture:
-            self.video_capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
-            ret, frame = self.video_capture.read()
-            if ret:
-                self.frame_ready.emit(frame)
-                self.video_capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        # Show the first frame kept from load_video - no seek or decode needed;
+        # read_frame_at() repositions the capture lazily when playback resumes
+        if self.video_capture and self.first_frame_image is not None:
+            self.frame_ready.emit(self.first_frame_image)
         
         self.position_changed.emit(0)
         
-    def seek_to_position(self, position_ms):
-        """Seek to a specific time position"""
+    def seek_to_position(self, position_ms, exact=True):
+        """Seek to a specific time position
+        
+        Pass exact=False while the user is still dragging the timeline: a
+        nearby cached frame is then shown instead of decoding the exact one.
+        """
         if not self.video_capture:
             return
             
-        print(f"Seeking to position: {position_ms}ms")  # Debug
+        logger.debug("Seeking to position: %sms", position_ms)
         
         target_frame = int((position_ms / 1000.0) * self.fps)
         target_frame = max(0, min(target_frame, self.total_frames - 1))
         
-        print(f"Target frame: {target_frame}")  # Debug
+        logger.debug("Target frame: %s", target_frame)
         
-        # Sync audio
+        # Sync audio; its reported position is stale until it catches up
+        self.audio_clock = None
         self.media_player.setPosition(position_ms)
         
-        # Immediately seek and emit frame (like original)
-        self.video_capture.set(cv2.CAP_PROP_POS_FRAMES, target_frame)
-        self.current_frame = target_frame
-        
-        # Read and emit the frame immediately
-        ret, frame = self.video_capture.read()
-        if ret:
-            self.frame_ready.emit(frame)
-            print("Frame emitted after seek")  # Debug
-        else:
-            print("Failed to read frame after seek")  # Debug
-            
-        # Reset position for next read
-        self.video_capture.set(cv2.CAP_PROP_POS_FRAMES, target_frame)
-            
-        # Emit position update
-        self.position_changed.emit(self.get_current_time_ms())
+        self.request_seek(target_frame, exact)
         
-        # Also set the seek flag for the threaded playback
-        self.mutex.lock()
-        self.seek_to_frame = target_frame
-        self.mutex.unlock()
-        
-    def seek_to_frame_number(self, frame_number):
+    def seek_to_frame_number(self, frame_number, exact=True):
         """Seek to specific frame number"""
         if not self.video_capture:
             return
             
-        print(f"Seeking to frame: {frame_number}")  # Debug
+        logger.debug("Seeking to frame: %s", frame_number)
         
         frame_number = max(0, min(frame_number, self.total_frames - 1))
         
         # Calculate position for audio sync
-        position_ms = int((frame_number / self.fps) * 1000)
+        position_ms = int(frame_number * self.frame_duration)
         
-        # Sync audio
+        # Sync audio; its reported position is stale until it catches up
+        self.audio_clock = None
         self.media_player.setPosition(position_ms)
         
-        # Immediately seek and emit frame (like original)
-        self.video_capture.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-        self.current_frame = frame_number
+        self.request_seek(frame_number, exact)
         
-        # Read and emit the frame immediately
-        ret, frame = self.video_capture.read()
-        if ret:
-            self.frame_ready.emit(frame)
-            print("Frame emitted after frame seek")  # Debug
-        else:
-            print("Failed to read frame after frame seek")  # Debug
+    def request_seek(self, frame_number, exact=True):
+        """Queue a seek - requests arriving before it is serviced replace each other"""
+        self.mutex.lock()
+        self.pending_seek = (frame_number, exact)
+        self.state_changed.wakeAll()
+        
+        # The playback thread services seeks itself; otherwise a short-lived
+        # seek thread does, so a slow decode never blocks the GUI. While it is
+        # busy, newer requests just replace the target it decodes next
+        start_worker = not self.isRunning() and not self.seek_worker_active
+        if start_worker:
+            self.seek_worker_active = True
+        self.mutex.unlock()
+        
+        if start_worker:
+            threading.Thread(target=self.service_seeks, daemon=True).start()
+            
+    def service_seeks(self):
+        """Seek thread: decode pending seeks until no newer one is waiting"""
+        while True:
+            self.process_pending_seek()
+            
+            self.mutex.lock()
+            done = self.pending_seek is None or self.isRunning()
+            if done:
+                self.seek_worker_active = False
+            self.mutex.unlock()
+            if done:
+                return
             
-        # Reset position for next read
-        self.video_capture.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+    def take_pending_seek(self):
+        """Atomically swap the pending seek out, returning (target, exact) or None"""
+        self.mutex.lock()
+        pending = self.pending_seek
+        self.pending_seek = None
+        self.mutex.unlock()
+        return pending
+        
+    def process_pending_seek(self):
+        """Decode and emit the latest requested seek target, if any"""
+        # The seek thread and the playback thread may both get here; taking
+        # the target under seek_mutex keeps an older seek from landing last
+        self.seek_mutex.lock()
+        try:
+            return self.seek_to_pending_target()
+        finally:
+            self.seek_mutex.unlock()
+            
+    def seek_to_pending_target(self):
+        """process_pending_seek's body, run under seek_mutex"""
+        pending = self.take_pending_seek()
+        if pending is None or not self.video_capture:
+            return False
+            
+        target_frame, exact = pending
+        
+        # Scrub previews may snap to a cached neighbour; the exact seek sent on
+        # slider release lands on the real frame
+        if not exact:
+            target_frame = self.find_cached_frame_near(
+                target_frame, int(self.fps * self.SCRUB_SNAP_SECONDS))
+            
+        self.current_frame = target_frame
+        if self.display_frame_at(target_frame):
+            logger.debug("Frame emitted after seek")
+        else:
+            logger.warning("Failed to read frame after seek")
             
         # Emit position update
         self.position_changed.emit(self.get_current_time_ms())
+        self.seek_completed.emit()
+        return True
+        
+    def read_frame_at(self, frame_number):
+        """Decode a frame, seeking only if the capture isn't already positioned on it"""
+        if self.next_decode_frame != frame_number:
+            if self.can_decode_forward_to(frame_number):
+                # No keyframe in between: a seek would decode these frames too
+                while self.next_decode_frame < frame_number and self.video_capture.grab():
+                    self.next_decode_frame += 1
+                    
+            if self.next_decode_frame != frame_number:
+                self.video_capture.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+            
+        # Decode into the same scratch array every time instead of a new one
+        ret, frame = self.video_capture.read(self.decode_scratch)
+        
+        if ret:
+            self.decode_scratch = frame
+            
+            # Larger than it will be shown: shrink once here, so the RGB32
+            # conversion, the cache and the GUI's blit all touch fewer pixels
+            fit_size = self.display_fit_size(*frame.shape[:2])
+            if fit_size is not None:
+                frame = cv2.resize(frame, fit_size, self.resize_scratch, interpolation=cv2.INTER_AREA)
+                self.resize_scratch = frame
+                
+            # First frame, or the decoder changed size - size the ring to match
+            height, width = frame.shape[:2]
+            slot_image = self.frame_ring[self.frame_ring_index] if self.frame_ring else None
+            if slot_image is None or (slot_image.height(), slot_image.width()) != (height, width):
+                self.allocate_frame_ring(height, width)
+                slot_image = self.frame_ring[self.frame_ring_index]
+                
+            # Qt's smooth scaler and QPixmap both work in RGB32 and would
+            # otherwise convert every BGR888 frame on the GUI thread; do that
+            # pass here, straight into the next ring slot. The writable view is
+            # taken per frame: bits() detaches the slot if the GUI (or a queued
+            # frame_ready) still shares its pixels, so those are never rewritten
+            slot_array = self.image_pixels(slot_image, 4, writable=True)
+            cv2.cvtColor(frame, cv2.COLOR_BGR2BGRA, dst=slot_array)
+            frame = slot_array
+            
+            self.frame_buffer, self.frame_buffer_image = slot_array, slot_image
+            self.frame_ring_index = (self.frame_ring_index + 1) % len(self.frame_ring)
+        
+        # A successful read leaves the capture on the following frame
+        self.next_decode_frame = frame_number + 1 if ret else -1
+        return ret, frame
+        
+    def set_display_size(self, width, height):
+        """Set the device-pixel size frames are displayed at (0 disables downscaling)
+        
+        Later decodes are shrunk to fit it. Cached frames were sized for the old
+        display, so they are dropped.
+        """
+        display_size = (width, height) if width > 0 and height > 0 else None
+        if display_size != self.display_size:
+            self.display_size = display_size
+            self.clear_frame_cache()
+            
+    def display_fit_size(self, height, width):
+        """(width, height) to shrink a decoded frame to, or None to keep it as is"""
+        display_size = self.display_size
+        if display_size is None:
+            return None
+            
+        scale = min(display_size[0] / width, display_size[1] / height)
+        if scale >= 1:
+            return None  # Never upscale; the painter does that
+        return max(1, int(width * scale)), max(1, int(height * scale))
+        
+    def decode_frame_image(self, frame_number):
+        """Decode a frame into its ring slot's QImage, or return None on failure
+        
+        Seeks may run on the seek thread while the playback thread decodes, and
+        both share one decoder and frame ring, so reads happen under
+        capture_mutex.
+        """
+        self.capture_mutex.lock()
+        try:
+            if not self.video_capture:
+                return None
+            ret, frame = self.read_frame_at(frame_number)
+            return self.frame_to_qimage(frame) if ret else None
+        finally:
+            self.capture_mutex.unlock()
+        
+    def grab_frames(self, frame_number, count):
+        """Advance the decoder past count frames starting at frame_number
+        
+        grab() demuxes and decodes but skips retrieve()'s BGR conversion and
+        copy, which is all that's needed for frames that won't be shown.
+        """
+        self.capture_mutex.lock()
+        try:
+            if not self.video_capture:
+                return False
+            if self.next_decode_frame != frame_number:
+                self.video_capture.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+                
+            for _ in range(count):
+                if not self.video_capture.grab():
+                    self.next_decode_frame = -1
+                    return False
+                    
+            self.next_decode_frame = frame_number + count
+            return True
+        finally:
+            self.capture_mutex.unlock()
+        
+    def display_frame_at(self, frame_number):
+        """Emit the given frame, decoding it only on a cache miss"""
+        image = self.get_cached_frame(frame_number)
+        
+        if image is None:
+            image = self.decode_frame_image(frame_number)
+            if image is None:
+                return False
+            self.cache_frame(frame_number, image)
+            
+        self.frame_ready.emit(image)
+        return True
+        
+    def get_cached_frame(self, frame_number):
+        """Return a cached frame image (marking it recently used) or None"""
+        self.mutex.lock()
+        image = self.frame_cache.get(frame_number)
+        if image is not None:
+            self.frame_cache.move_to_end(frame_number)
+        self.mutex.unlock()
+        return image
+        
+    def cache_frame(self, frame_number, image):
+        """Store a frame in the LRU cache, evicting the oldest entries"""
+        # Once the cache is full, the entry about to be evicted is recycled as
+        # the buffer for this one, so steady playback allocates nothing here
+        self.mutex.lock()
+        recycled = None
+        if len(self.frame_cache) >= self.FRAME_CACHE_SIZE and frame_number not in self.frame_cache:
+            recycled = self.frame_cache.popitem(last=False)[1]
+        self.mutex.unlock()
+        
+        # RGB565 halves the footprint (64 x 1080p stays under ~270 MB)
+        if (recycled is not None and recycled.size() == image.size()
+                and image.format() == QImage.Format.Format_RGB32):
+            # OpenCV's BGR565 packs red into the high bits, matching Qt's RGB565
+            cv2.cvtColor(self.image_pixels(image, 4), cv2.COLOR_BGRA2BGR565,
+                         dst=self.image_pixels(recycled, 2, writable=True))
+            cached = recycled
+        else:
+            cached = image.convertToFormat(QImage.Format.Format_RGB565)
+        
+        self.mutex.lock()
+        self.frame_cache[frame_number] = cached
+        self.frame_cache.move_to_end(frame_number)
+        while len(self.frame_cache) > self.FRAME_CACHE_SIZE:
+            self.frame_cache.popitem(last=False)
+        self.mutex.unlock()
         
-        # Also set the seek flag for the threaded playback
+    def find_cached_frame_near(self, frame_number, tolerance):
+        """Return the cached frame closest to frame_number within tolerance, else frame_number"""
         self.mutex.lock()
-        self.seek_to_frame = frame_number
+        nearest = min(self.frame_cache, key=lambda cached: abs(cached - frame_number), default=None)
+        self.mutex.unlock()
+        
+        if nearest is not None and abs(nearest - frame_number) <= tolerance:
+            return nearest
+        return frame_number
+        
+    def clear_frame_cache(self):
+        """Drop all cached frames"""
+        self.mutex.lock()
+        self.frame_cache.clear()
         self.mutex.unlock()
         
     def next_frame(self):
         """Go to next frame"""
-        if self.current_frame < self.total_frames - 1:
-            self.seek_to_frame_number(self.current_frame + 1)
+        frame = self.get_target_frame()
+        if frame < self.total_frames - 1:
+            self.seek_to_frame_number(frame + 1)
             
     def previous_frame(self):
         """Go to previous frame"""
-        if self.current_frame > 0:
-            self.seek_to_frame_number(self.current_frame - 1)
+        frame = self.get_target_frame()
+        if frame > 0:
+            self.seek_to_frame_number(frame - 1)
+            
+    def get_target_frame(self):
+        """Frame being shown, or the one about to be shown if a seek is pending"""
+        self.mutex.lock()
+        pending = self.pending_seek
+        self.mutex.unlock()
+        return pending[0] if pending is not None else self.current_frame
             
     def set_volume(self, volume):
         """Set audio volume (0-100)"""
@@ -220,7 +858,7 @@ class VideoPlayerEngine(QThread):
             
     def get_current_time_ms(self):
         """Get current playback time in milliseconds"""
-        return int((self.current_frame / self.fps) * 1000)
+        return int(self.current_frame * self.frame_duration)
         
     def get_duration_ms(self):
         """Get total video duration in milliseconds"""
@@ -246,58 +884,202 @@ class VideoPlayerEngine(QThread):
             'path': self.video_path
         }
     
+    def restart_decode_ahead(self, frame_number):
+        """Discard decoded-ahead frames and have the decoder continue from frame_number"""
+        with self.decode_ready:
+            self.decode_generation += 1
+            self.decoded_frames.clear()
+            self.decode_ahead_frame = frame_number
+            self.decode_ready.notify_all()
+            
+    def decode_ahead(self):
+        """Decoder thread: keep up to DECODE_AHEAD_FRAMES frames decoded ahead of playback"""
+        while self.is_playing:
+            with self.decode_ready:
+                # Block while the channel is full or there's nothing to decode
+                while self.is_playing and (len(self.decoded_frames) >= self.DECODE_AHEAD_FRAMES
+                                           or self.decode_ahead_frame < 0):
+                    self.decode_ready.wait()
+                if not self.is_playing:
+                    break
+                generation = self.decode_generation
+                frame_number = self.decode_ahead_frame
+                
+            # Frames the screen can't show are grabbed but never converted
+            skip = min(self.display_frame_step - 1, self.total_frames - frame_number - 1)
+            if skip > 0:
+                self.grab_frames(frame_number, skip)
+                frame_number += skip
+                
+            image = self.decode_frame_image(frame_number)
+            
+            with self.decode_ready:
+                # A seek restarted the channel while we were decoding
+                if generation != self.decode_generation:
+                    continue
+                self.decoded_frames.append((frame_number, image))
+                self.decode_ahead_frame = frame_number + 1 if image is not None else -1
+                self.decode_ready.notify_all()
+                
+    def wait_for_preroll(self):
+        """Block until preroll_frame_count frames are decoded ahead, or decoding stops"""
+        target = min(self.preroll_frame_count, self.DECODE_AHEAD_FRAMES)
+        with self.decode_ready:
+            while (self.is_playing and self.pending_seek is None
+                   and len(self.decoded_frames) < target and self.decode_ahead_frame >= 0):
+                self.decode_ready.wait(0.05)
+                
+    def take_decoded_frame(self, overdue):
+        """Pop the next decoded (frame number, image), dropping up to overdue late frames
+        
+        Returns None if playback stopped or a seek arrived while waiting.
+        """
+        with self.decode_ready:
+            while not self.decoded_frames:
+                if not self.is_playing or self.pending_seek is not None:
+                    return None
+                self.decode_ready.wait(0.05)
+                
+            item = self.decoded_frames.popleft()
+            while overdue > 0 and self.decoded_frames and item[1] is not None:
+                item = self.decoded_frames.popleft()
+                overdue -= 1
+                
+            # Room in the channel again
+            self.decode_ready.notify_all()
+            return item
+    
+    def frame_time_ns(self, frame_number):
+        """Presentation time of a frame in nanoseconds from the start of the video"""
+        return int(frame_number * self.frame_duration_ns)
+        
+    def anchor_playback_clock(self):
+        """Pin the playback clock so the current frame is 'now'"""
+        self.play_started_ns = time.monotonic_ns() - self.frame_time_ns(self.current_frame)
+    
+    def sync_to_audio_clock(self):
+        """Pin the playback clock to the latest audio position; False if there is none
+        
+        The audio device's clock is the authority while sound is playing: frame
+        deadlines follow it, and overdue-frame dropping keeps video within a
+        frame of it.
+        """
+        clock = self.audio_clock
+        if clock is None:
+            return False
+            
+        if clock is not self.applied_audio_clock:
+            position_ms, reported_ns = clock
+            self.play_started_ns = reported_ns - int((position_ms - self.av_offset_ms) * 1_000_000)
+            self.applied_audio_clock = clock
+        return True
+    
     def run(self):
-        """Main playback loop (like original)"""
-        last_frame_time = time.time()
+        """Main playback loop - paces frames decoded ahead by the decoder thread
+        
+        Every frame's deadline is derived from one monotonic anchor rather
+        than from the previous frame, so timing errors never accumulate.
+        """
+        frame_ns = self.frame_time_ns(1)
+        
+        # Bind what the per-frame path touches to locals once, rather than
+        # looking each up through self on every iteration
+        frame_duration_ns = self.frame_duration_ns
+        monotonic_ns = time.monotonic_ns
+        mutex = self.mutex
+        state_changed = self.state_changed
+        sync_to_audio_clock = self.sync_to_audio_clock
+        take_decoded_frame = self.take_decoded_frame
+        emit_frame = self.frame_ready.emit
+        emit_position = self.position_changed.emit
+        cache_frame = self.cache_frame
+        last_position_emit_ns = 0
+        
+        self.restart_decode_ahead(self.current_frame + 1)
+        decoder = threading.Thread(target=self.decode_ahead, daemon=True)
+        decoder.start()
+        self.wait_for_preroll()
+        self.anchor_playback_clock()
         
         while self.is_playing and self.video_capture and self.video_capture.isOpened():
-            current_time = time.time()
+            mutex.lock()
             
-            # Handle seeking
-            self.mutex.lock()
-            if self.seek_to_frame >= 0:
-                self.video_capture.set(cv2.CAP_PROP_POS_FRAMES, self.seek_to_frame)
-                self.current_frame = self.seek_to_frame
-                self.seek_to_frame = -1
-                last_frame_time = current_time
-                
-                # Sync audio position
-                audio_position_ms = int((self.current_frame / self.fps) * 1000)
-                self.media_player.setPosition(audio_position_ms)
-            self.mutex.unlock()
+            # Handle seeking - only the most recent request is decoded
+            if self.pending_seek is not None:
+                mutex.unlock()
+                self.process_pending_seek()
+                self.restart_decode_ahead(self.current_frame + 1)
+                self.wait_for_preroll()
+                self.anchor_playback_clock()
+                continue
             
-            # Skip frame timing if paused
+            # Block while paused - play(), seeks and stop() wake us up
             if self.is_paused:
-                self.msleep(16)  # Sleep for ~60 FPS
+                # Report exactly where we stopped; playback updates are throttled
+                emit_position(int(self.current_frame * self.frame_duration))
+                state_changed.wait(mutex)
+                mutex.unlock()
+                self.wait_for_preroll()
+                self.anchor_playback_clock()
                 continue
                 
-            # Check if it's time for the next frame
-            if (current_time - last_frame_time) >= (self.frame_duration / 1000.0):
-                ret, frame = self.video_capture.read()
+            # Sleep until the next frame is due (woken early on state changes)
+            sync_to_audio_clock()
+            current_frame = self.current_frame
+            deadline_ns = self.play_started_ns + int((current_frame + 1) * frame_duration_ns)
+            delay_ms = (deadline_ns - monotonic_ns()) // 1_000_000
+            if delay_ms > 0:
+                state_changed.wait(mutex, delay_ms)
+                mutex.unlock()
+                continue
+            mutex.unlock()
+            
+            # A quick stop()/play() can let the decoder thread exit under us
+            if not decoder.is_alive():
+                decoder = threading.Thread(target=self.decode_ahead, daemon=True)
+                decoder.start()
                 
-                if ret:
-                    self.frame_ready.emit(frame)
-                    self.current_frame += 1
-                    
-                    # Emit position
-                    position_ms = self.get_current_time_ms()
-                    self.position_changed.emit(position_ms)
-                    
-                    last_frame_time = current_time
-                    
-                    # Check if we've reached the end
-                    if self.current_frame >= self.total_frames:
-                        self.playback_finished.emit()
-                        self.is_playing = False
-                        break
-                else:
-                    # End of video
+            # If we fell behind, skip decoded frames that are already overdue
+            overdue = (monotonic_ns() - deadline_ns) // frame_ns
+            item = take_decoded_frame(overdue)
+            if item is None:
+                continue
+                
+            frame_number, image = item
+            
+            if image is not None:
+                emit_frame(image)
+                self.current_frame = frame_number
+                cache_frame(frame_number, image)
+                
+                # Emit position, throttled - the time label can't usefully
+                # change at frame rate
+                now_ns = monotonic_ns()
+                if now_ns - last_position_emit_ns >= self.POSITION_UPDATE_INTERVAL_NS:
+                    emit_position(int(frame_number * self.frame_duration))
+                    last_position_emit_ns = now_ns
+                
+                # If decoding couldn't keep up even with dropping, restart the
+                # clock here rather than racing to catch up (unless the audio
+                # clock is in charge - then we keep dropping until we're back)
+                if (not sync_to_audio_clock() and
+                        monotonic_ns() > self.play_started_ns + int((frame_number + 2) * frame_duration_ns)):
+                    self.anchor_playback_clock()
+                
+                # Check if we've reached the end
+                if frame_number >= self.total_frames:
                     self.playback_finished.emit()
                     self.is_playing = False
                     break
-                    
-            # Small sleep to prevent high CPU usage
-            self.msleep(1)
+            else:
+                # End of video
+                self.playback_finished.emit()
+                self.is_playing = False
+                break
+                
+        # Let the decoder thread see is_playing is off and exit
+        self.wake_decoder()
+        decoder.join()
     
     # Audio player signal handlers
     def on_audio_duration_changed(self, duration_ms):
@@ -305,6 +1087,13 @@ class VideoPlayerEngine(QThread):
         # We use video duration, not audio duration
         pass
         
+    def on_audio_position_changed(self, position_ms):
+        """Record the audio clock for the playback thread (GUI thread only reads QMediaPlayer)"""
+        if self.media_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
+            self.audio_clock = (position_ms, time.monotonic_ns())
+        else:
+            self.audio_clock = None
+            
     def on_audio_status_changed(self, status):
         """Handle audio status changes"""
         if status == QMediaPlayer.MediaStatus.EndOfMedia:
@@ -312,18 +1101,33 @@ class VideoPlayerEngine(QThread):
             if self.is_playing:
                 self.playback_finished.emit()
                 self.is_playing = False
+                self.wake_playback_thread()
                 
     def on_audio_error(self, error, error_string):
         """Handle audio player errors"""
-        print(f"Audio error: {error_string}")  # Just log, don't fail video
+        logger.warning("Audio error: %s", error_string)  # Just log, don't fail video
     
     def cleanup(self):
         """Clean up resources"""
         self.is_playing = False
+        self.wake_playback_thread()
         self.wait()  # Wait for thread to finish
         
         self.media_player.stop()
         
+        self.capture_mutex.lock()
         if self.video_capture:
             self.video_capture.release()
-            self.video_capture = None
\ No newline at end of file
+            self.video_capture = None
+        self.capture_mutex.unlock()
+        
+        if self.temp_video_path:
+            self.remove_temp_video()
+            
+        self.clear_frame_cache()
+        self.first_frame_image = None
+        self.decode_scratch = None
+        self.resize_scratch = None
+        self.frame_ring = []
+        self.frame_buffer = None
+        self.frame_buffer_image = None
\ No newline at end of file
@@ -1,66 +1,212 @@
 # src/gui/export_dialog.py
 
 import os
+import cv2
+import logging
+from collections import OrderedDict
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QSlider, QSpinBox, QProgressBar,
                              QFileDialog, QMessageBox, QFrame, QGroupBox,
-                             QComboBox, QCheckBox, QGridLayout)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QFont, QPixmap
+                             QComboBox, QCheckBox, QGridLayout, QApplication)
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject, QRunnable, QThreadPool, QMutex, QMutexLocker
+from PyQt6.QtGui import QFont, QPixmap, QImage
 from src.core.gif_exporter import GifExporter
+from src.core.frame_manager import FrameManager
+
+logger = logging.getLogger(__name__)
+
+# Dialog stylesheets, applied once on GifExportDialog so Qt parses them a
+# single time and child widgets inherit the rules
+DIALOG_STYLE = """
+    QDialog {
+        background-color: #1e1e1e;
+        color: white;
+    }
+    QLabel {
+        color: white;
+        font-size: 12px;
+    }
+    QPushButton {
+        background-color: #0078d4;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-size: 12px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #106ebe;
+    }
+    QPushButton:pressed {
+        background-color: #005a9e;
+    }
+    QPushButton:disabled {
+        background-color: #666666;
+        color: #999999;
+    }
+    QSpinBox, QComboBox {
+        background-color: #2d2d2d;
+        color: white;
+        border: 1px solid #555555;
+        border-radius: 4px;
+        padding: 4px;
+    }
+    QSpinBox::up-button, QSpinBox::down-button {
+        background-color: #0078d4;
+        border: none;
+        width: 16px;
+    }
+    QSpinBox::up-button:hover, QSpinBox::down-button:hover {
+        background-color: #106ebe;
+    }
+    QProgressBar {
+        border: 1px solid #555555;
+        border-radius: 4px;
+        text-align: center;
+        background-color: #2d2d2d;
+    }
+    QProgressBar::chunk {
+        background-color: #0078d4;
+        border-radius: 3px;
+    }
+"""
+
+GROUP_BOX_STYLE = """
+    QGroupBox {
+        font-size: 14px;
+        font-weight: bold;
+        color: white;
+        border: 2px solid #0078d4;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+        background-color: #1e1e1e;
+    }
+"""
+
+TIME_SLIDER_STYLE = """
+    QSlider::groove:horizontal {
+        border: none;
+        height: 6px;
+        background: rgba(255, 255, 255, 0.2);
+        border-radius: 3px;
+    }
+    QSlider::handle:horizontal {
+        background: #0078d4;
+        border: 2px solid #ffffff;
+        width: 20px;
+        height: 20px;
+        border-radius: 10px;
+        margin: -8px 0;
+    }
+    QSlider::handle:horizontal:hover {
+        background: #106ebe;
+        border: 2px solid #ffffff;
+    }
+    QSlider::sub-page:horizontal {
+        background: #0078d4;
+        border-radius: 3px;
+    }
+"""
+
+# Per-widget variants, selected by object name
+WIDGET_VARIANTS_STYLE = """
+    QLabel#startFramePreview, QLabel#endFramePreview {
+        background-color: #000000;
+        border: 2px solid #0078d4;
+        border-radius: 4px;
+        color: #666666;
+    }
+    QLabel#endFramePreview {
+        border-color: #ff6b00;
+    }
+    QPushButton#jumpToStartButton, QPushButton#jumpToEndButton {
+        padding: 4px 8px;
+        border-radius: 3px;
+        font-size: 10px;
+    }
+    QPushButton#jumpToEndButton {
+        background-color: #ff6b00;
+    }
+    QPushButton#jumpToEndButton:hover {
+        background-color: #e55a00;
+    }
+    QPushButton#exportButton {
+        background-color: #ff6b00;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton#exportButton:hover {
+        background-color: #e55a00;
+    }
+"""
 
 class ModernGroupBox(QGroupBox):
-    """Modern styled group box"""
+    """Modern styled group box (styled by GROUP_BOX_STYLE on the dialog)"""
     
     def __init__(self, title=""):
         super().__init__(title)
-        self.setStyleSheet("""
-            QGroupBox {
-                font-size: 14px;
-                font-weight: bold;
-                color: white;
-                border: 2px solid #0078d4;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                background-color: #1e1e1e;
-            }
-        """)
 
 class TimeSlider(QSlider):
-    """Custom time slider with modern styling"""
+    """Custom time slider with modern styling (styled by TIME_SLIDER_STYLE on the dialog)"""
     
     def __init__(self, orientation=Qt.Orientation.Horizontal):
         super().__init__(orientation)
-        self.setStyleSheet("""
-            QSlider::groove:horizontal {
-                border: none;
-                height: 6px;
-                background: rgba(255, 255, 255, 0.2);
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background: #0078d4;
-                border: 2px solid #ffffff;
-                width: 20px;
-                height: 20px;
-                border-radius: 10px;
-                margin: -8px 0;
-            }
-            QSlider::handle:horizontal:hover {
-                background: #106ebe;
-                border: 2px solid #ffffff;
-            }
-            QSlider::sub-page:horizontal {
-                background: #0078d4;
-                border-radius: 3px;
-            }
-        """)
+
+class FrameExtractSignals(QObject):
+    """Signals for FrameExtractWorker (QRunnable cannot declare signals)"""
+    
+    # side, request id, detached QImage (null on failure). Only QImage may
+    # cross threads; the GUI thread turns it into a QPixmap
+    finished = pyqtSignal(str, int, QImage)
+
+class FrameExtractWorker(QRunnable):
+    """Decode a preview frame on the thread pool"""
+    
+    def __init__(self, extract_frame, time_seconds, side, request_id, is_stale):
+        super().__init__()
+        self.extract_frame = extract_frame
+        self.time_seconds = time_seconds
+        self.side = side
+        self.request_id = request_id
+        self.is_stale = is_stale
+        self.signals = FrameExtractSignals()
+        
+    def cancelled(self):
+        """True once a newer preview was requested for the same side"""
+        return self.is_stale(self.side, self.request_id)
+        
+    def run(self):
+        if self.cancelled():
+            return
+            
+        image = self.extract_frame(self.time_seconds, self.cancelled)
+        if not self.cancelled():
+            self.signals.finished.emit(self.side, self.request_id, image)
+
+class PreviewStripSignals(QObject):
+    """Signals for PreviewStripWorker"""
+    
+    batch_ready = pyqtSignal(object)  # list of (time_seconds, QImage)
+
+class PreviewStripWorker(QRunnable):
+    """Decode a sparse strip of preview frames on the thread pool"""
+    
+    def __init__(self, extract_strip, times):
+        super().__init__()
+        self.extract_strip = extract_strip
+        self.times = times
+        self.signals = PreviewStripSignals()
+        
+    def run(self):
+        for batch in self.extract_strip(self.times):
+            self.signals.batch_ready.emit(batch)
 
 class GifExportDialog(QDialog):
     """Dialog for exporting video segments as GIF"""
@@ -68,6 +214,37 @@ class GifExportDialog(QDialog):
     # Signal to communicate with main window
     preview_frame_requested = pyqtSignal(float)  # Request frame at specific time
     
+    # Quiet time after the last slider tick before previews are refreshed
+    PREVIEW_DEBOUNCE_MS = 200
+    
+    # Title font, built on first use (needs a QApplication) and shared by
+    # every dialog instance
+    title_font = None
+    
+    # Scaled preview pixmaps kept for scrubbing back and forth
+    PREVIEW_CACHE_SIZE = 32
+    
+    # Size of the start/end preview labels
+    PREVIEW_WIDTH = 200
+    PREVIEW_HEIGHT = 112
+    
+    # Targets this few frames past the capture position are reached with
+    # grab() instead of a container seek
+    PREVIEW_FORWARD_GRAB_FRAMES = 8
+    
+    # Frames precomputed across the video after the dialog opens, and how
+    # many are handed to the GUI thread at once
+    PREVIEW_STRIP_FRAMES = 16
+    PREVIEW_STRIP_BATCH = 4
+    
+    # Strip gaps up to this many frames are decoded through with grab();
+    # wider gaps (long videos) are cheaper to seek across
+    PREVIEW_STRIP_MAX_GRAB = 300
+    
+    # Time sliders move in 0.1 s ticks, coarsened on long videos so a slider
+    # never has more than this many positions
+    SLIDER_MAX_TICKS = 2000
+    
     def __init__(self, parent=None, video_path=None, duration_ms=0, current_position_ms=0):
         super().__init__(parent)
         self.video_path = video_path
@@ -80,16 +257,60 @@ class GifExportDialog(QDialog):
         self.start_time = current_position_ms / 1000.0  # Start from current position
         self.end_time = min(self.start_time + 10, self.duration_seconds)  # Default 10 seconds or end of video
         self.gif_exporter = GifExporter()
+        self.frame_manager = FrameManager()
         
         # Frame preview
         self.start_frame_pixmap = None
         self.end_frame_pixmap = None
         
+        # Slider ticks only mark previews stale; this timer refreshes them
+        # once the user pauses
+        self.pending_preview_sides = set()  # 'start' and/or 'end'
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.timeout.connect(self.refresh_pending_previews)
+        
+        # Frames are decoded on the thread pool; only the newest request for
+        # each side is displayed
+        self.preview_request_ids = {'start': 0, 'end': 0}
+        self.preview_request_keys = {'start': None, 'end': None}
+        
+        # LRU of scaled previews keyed by (video path, time in 0.1 s steps)
+        self.preview_cache = OrderedDict()
+        
+        # Previews are decoded at device-pixel size and tagged with this ratio,
+        # so HiDPI screens show them 1:1 instead of upscaling a logical-size image
+        self.preview_pixel_ratio = self.devicePixelRatioF()
+        
+        # One capture shared by all preview extractions, opened on first use.
+        # Workers for both sides may run at once, so seeks are serialized
+        self.preview_capture = None
+        self.preview_fps = 0
+        self.preview_next_frame = -1  # frame the capture will read next
+        self.preview_capture_closed = False
+        self.preview_capture_mutex = QMutex()
+        
+        # Estimated bytes per second of GIF keyed by (fps, width, height, quality),
+        # so slider ticks only scale it by the duration
+        self.size_rate_cache = {}
+        self.size_estimate_style = None
+        
+        # Inputs of the last size estimate, to skip no-op updates
+        self.last_preview_key = None
+        
+        # "mm:ss" for every whole second of the video, and the texts the time
+        # labels currently show, so slider ticks only touch labels that change
+        self.time_texts = [f"{i // 60:02d}:{i % 60:02d}" for i in range(int(self.duration_seconds) + 2)]
+        self.time_label_texts = (None, None, None)
+        
         self.setup_ui()
         self.connect_signals()
         self.update_preview()
         self.load_frame_previews()
         
+        # Warm the preview cache once the dialog is up
+        QTimer.singleShot(500, self.precompute_preview_strip)
+        
     def setup_ui(self):
         """Setup the dialog UI"""
         self.setWindowTitle("Export GIF")
@@ -97,72 +318,21 @@ class GifExportDialog(QDialog):
         self.setMinimumSize(600, 500)
         
         # Apply dark theme
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1e1e1e;
-                color: white;
-            }
-            QLabel {
-                color: white;
-                font-size: 12px;
-            }
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-            QPushButton:disabled {
-                background-color: #666666;
-                color: #999999;
-            }
-            QSpinBox, QComboBox {
-                background-color: #2d2d2d;
-                color: white;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 4px;
-            }
-            QSpinBox::up-button, QSpinBox::down-button {
-                background-color: #0078d4;
-                border: none;
-                width: 16px;
-            }
-            QSpinBox::up-button:hover, QSpinBox::down-button:hover {
-                background-color: #106ebe;
-            }
-            QProgressBar {
-                border: 1px solid #555555;
-                border-radius: 4px;
-                text-align: center;
-                background-color: #2d2d2d;
-            }
-            QProgressBar::chunk {
-                background-color: #0078d4;
-                border-radius: 3px;
-            }
-        """)
+        self.setStyleSheet(DIALOG_STYLE + GROUP_BOX_STYLE + TIME_SLIDER_STYLE + WIDGET_VARIANTS_STYLE)
         
         layout = QVBoxLayout()
         
         # Title
         title_label = QLabel("Export Video Segment as GIF")
-        title_font = QFont("Segoe UI", 16, QFont.Weight.Bold)
-        title_label.setFont(title_font)
+        if GifExportDialog.title_font is None:
+            GifExportDialog.title_font = QFont("Segoe UI", 16, QFont.Weight.Bold)
+            GifExportDialog.title_font.setStyleStrategy(QFont.StyleStrategy.PreferAntialias)
+        title_label.setFont(GifExportDialog.title_font)
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title_label)
         
         # Time selection group
-        time_group = ModernGroupBox("Time Selection")
+        self.time_group = time_group = ModernGroupBox("Time Selection")
         time_layout = QVBoxLayout()
         
         # Current video info
@@ -174,9 +344,18 @@ class GifExportDialog(QDialog):
         start_layout = QHBoxLayout()
         start_layout.addWidget(QLabel("Start Time:"))
         
+        # Tick -> seconds table shared by both sliders
+        ticks = int(self.duration_seconds * 10)
+        if ticks > self.SLIDER_MAX_TICKS:
+            ticks = self.SLIDER_MAX_TICKS
+            self.seconds_per_tick = self.duration_seconds / ticks
+        else:
+            self.seconds_per_tick = 0.1  # 0.1 second precision
+        self.tick_seconds = [tick * self.seconds_per_tick for tick in range(ticks + 1)]
+        
         self.start_slider = TimeSlider()
-        self.start_slider.setMaximum(int(self.duration_seconds * 10))  # 0.1 second precision
-        self.start_slider.setValue(int(self.start_time * 10))  # Start from current position
+        self.start_slider.setMaximum(ticks)
+        self.start_slider.setValue(self.seconds_to_tick(self.start_time))  # Start from current position
         start_layout.addWidget(self.start_slider)
         
         self.start_time_label = QLabel(self.format_time(self.start_time))
@@ -191,8 +370,8 @@ class GifExportDialog(QDialog):
         end_layout.addWidget(QLabel("End Time:"))
         
         self.end_slider = TimeSlider()
-        self.end_slider.setMaximum(int(self.duration_seconds * 10))
-        self.end_slider.setValue(int(self.end_time * 10))  # End time based on start + duration
+        self.end_slider.setMaximum(ticks)
+        self.end_slider.setValue(self.seconds_to_tick(self.end_time))  # End time based on start + duration
         end_layout.addWidget(self.end_slider)
         
         self.end_time_label = QLabel(self.format_time(self.end_time))
@@ -226,24 +405,22 @@ class GifExportDialog(QDialog):
         # Size setting
         settings_layout.addWidget(QLabel("Size:"), 1, 0)
         self.size_combo = QComboBox()
-        self.size_combo.addItems([
-            "Small (320x180)",
-            "Medium (480x270)", 
-            "Large (640x360)",
-            "HD (960x540)",
-            "Original Size"
-        ])
+        # Item data holds the export dimensions (None for original size)
+        self.size_combo.addItem("Small (320x180)", (320, 180))
+        self.size_combo.addItem("Medium (480x270)", (480, 270))
+        self.size_combo.addItem("Large (640x360)", (640, 360))
+        self.size_combo.addItem("HD (960x540)", (960, 540))
+        self.size_combo.addItem("Original Size", None)
         self.size_combo.setCurrentText("Medium (480x270)")
         settings_layout.addWidget(self.size_combo, 1, 1)
         
         # Quality setting
         settings_layout.addWidget(QLabel("Quality:"), 2, 0)
         self.quality_combo = QComboBox()
-        self.quality_combo.addItems([
-            "Low (Smaller file)",
-            "Medium (Balanced)",
-            "High (Larger file)"
-        ])
+        # Item data holds the exporter quality value
+        self.quality_combo.addItem("Low (Smaller file)", 70)
+        self.quality_combo.addItem("Medium (Balanced)", 85)
+        self.quality_combo.addItem("High (Larger file)", 95)
         self.quality_combo.setCurrentText("Medium (Balanced)")
         settings_layout.addWidget(self.quality_combo, 2, 1)
         
@@ -270,34 +447,15 @@ class GifExportDialog(QDialog):
         start_frame_layout.addWidget(start_frame_label)
         
         self.start_frame_preview = QLabel()
-        self.start_frame_preview.setFixedSize(200, 112)  # 16:9 aspect ratio
+        self.start_frame_preview.setFixedSize(self.PREVIEW_WIDTH, self.PREVIEW_HEIGHT)  # 16:9 aspect ratio
         self.start_frame_preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.start_frame_preview.setStyleSheet("""
-            QLabel {
-                background-color: #000000;
-                border: 2px solid #0078d4;
-                border-radius: 4px;
-                color: #666666;
-            }
-        """)
+        self.start_frame_preview.setObjectName("startFramePreview")
         self.start_frame_preview.setText("Loading...")
         start_frame_layout.addWidget(self.start_frame_preview)
         
         # Jump to start button
         self.jump_to_start_btn = QPushButton("Jump to Start")
-        self.jump_to_start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                padding: 4px 8px;
-                border-radius: 3px;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-        """)
+        self.jump_to_start_btn.setObjectName("jumpToStartButton")
         start_frame_layout.addWidget(self.jump_to_start_btn)
         
         frames_layout.addLayout(start_frame_layout)
@@ -316,34 +474,15 @@ class GifExportDialog(QDialog):
         end_frame_layout.addWidget(end_frame_label)
         
         self.end_frame_preview = QLabel()
-        self.end_frame_preview.setFixedSize(200, 112)  # 16:9 aspect ratio
+        self.end_frame_preview.setFixedSize(self.PREVIEW_WIDTH, self.PREVIEW_HEIGHT)  # 16:9 aspect ratio
         self.end_frame_preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.end_frame_preview.setStyleSheet("""
-            QLabel {
-                background-color: #000000;
-                border: 2px solid #ff6b00;
-                border-radius: 4px;
-                color: #666666;
-            }
-        """)
+        self.end_frame_preview.setObjectName("endFramePreview")
         self.end_frame_preview.setText("Loading...")
         end_frame_layout.addWidget(self.end_frame_preview)
         
         # Jump to end button
         self.jump_to_end_btn = QPushButton("Jump to End")
-        self.jump_to_end_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ff6b00;
-                color: white;
-                border: none;
-                padding: 4px 8px;
-                border-radius: 3px;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background-color: #e55a00;
-            }
-        """)
+        self.jump_to_end_btn.setObjectName("jumpToEndButton")
         end_frame_layout.addWidget(self.jump_to_end_btn)
         
         frames_layout.addLayout(end_frame_layout)
@@ -374,16 +513,7 @@ class GifExportDialog(QDialog):
         
         self.export_button = QPushButton("Export GIF")
         self.export_button.setMinimumHeight(40)
-        self.export_button.setStyleSheet("""
-            QPushButton {
-                background-color: #ff6b00;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #e55a00;
-            }
-        """)
+        self.export_button.setObjectName("exportButton")
         button_layout.addWidget(self.export_button)
         
         self.cancel_button = QPushButton("Cancel")
@@ -396,12 +526,16 @@ class GifExportDialog(QDialog):
         
     def connect_signals(self):
         """Connect all signals"""
-        self.start_slider.valueChanged.connect(self.on_start_changed)
-        self.end_slider.valueChanged.connect(self.on_end_changed)
-        self.fps_spin.valueChanged.connect(self.update_preview)
-        self.size_combo.currentTextChanged.connect(self.update_preview)
-        self.quality_combo.currentTextChanged.connect(self.update_preview)
-        self.optimize_check.toggled.connect(self.update_preview)
+        # Widget signals are emitted on the GUI thread: call slots directly
+        direct = Qt.ConnectionType.DirectConnection
+        self.start_slider.valueChanged.connect(self.on_start_changed, direct)
+        self.end_slider.valueChanged.connect(self.on_end_changed, direct)
+        self.start_slider.sliderReleased.connect(self.refresh_pending_previews, direct)
+        self.end_slider.sliderReleased.connect(self.refresh_pending_previews, direct)
+        self.fps_spin.valueChanged.connect(self.update_preview, direct)
+        self.size_combo.currentTextChanged.connect(self.update_preview, direct)
+        self.quality_combo.currentTextChanged.connect(self.update_preview, direct)
+        self.optimize_check.toggled.connect(self.update_preview, direct)
         
         self.export_button.clicked.connect(self.start_export)
         self.cancel_button.clicked.connect(self.reject)
@@ -410,36 +544,77 @@ class GifExportDialog(QDialog):
         self.jump_to_start_btn.clicked.connect(self.jump_to_start)
         self.jump_to_end_btn.clicked.connect(self.jump_to_end)
         
-        # GIF exporter signals
-        self.gif_exporter.progress_updated.connect(self.update_progress)
-        self.gif_exporter.export_finished.connect(self.on_export_finished)
-        self.gif_exporter.export_failed.connect(self.on_export_failed)
+        # GIF exporter signals come from its worker thread
+        queued = Qt.ConnectionType.QueuedConnection
+        self.gif_exporter.progress_updated.connect(self.update_progress, queued)
+        self.gif_exporter.export_finished.connect(self.on_export_finished, queued)
+        self.gif_exporter.export_failed.connect(self.on_export_failed, queued)
         
     def on_start_changed(self, value):
         """Handle start time slider change"""
-        self.start_time = value / 10.0  # Convert to seconds
+        self.start_time = self.tick_seconds[value]
         
         # Ensure start is before end
         if self.start_time >= self.end_time:
             self.end_time = min(self.duration_seconds, self.start_time + 1)
-            self.end_slider.setValue(int(self.end_time * 10))
+            self.correct_other_slider(self.end_slider, self.end_time)
+            self.schedule_preview_refresh('end')
+        else:
+            self.update_time_labels()
             
-        self.update_time_labels()
-        self.update_preview()
-        self.load_start_frame_preview()
+        self.schedule_preview_refresh('start')
         
     def on_end_changed(self, value):
         """Handle end time slider change"""
-        self.end_time = value / 10.0  # Convert to seconds
+        self.end_time = self.tick_seconds[value]
         
         # Ensure end is after start
         if self.end_time <= self.start_time:
             self.start_time = max(0, self.end_time - 1)
-            self.start_slider.setValue(int(self.start_time * 10))
+            self.correct_other_slider(self.start_slider, self.start_time)
+            self.schedule_preview_refresh('start')
+        else:
+            self.update_time_labels()
             
-        self.update_time_labels()
+        self.schedule_preview_refresh('end')
+        
+    def seconds_to_tick(self, seconds):
+        """Slider position closest to a time in seconds"""
+        tick = int(round(seconds / self.seconds_per_tick))
+        return max(0, min(tick, len(self.tick_seconds) - 1))
+        
+    def correct_other_slider(self, slider, seconds):
+        """Move the opposite slider and refresh the labels in one repaint"""
+        # Signals are blocked so the slider's own handler is not re-entered,
+        # and painting is held until the slider and all three labels changed
+        self.time_group.setUpdatesEnabled(False)
+        try:
+            slider.blockSignals(True)
+            slider.setValue(self.seconds_to_tick(seconds))
+            slider.blockSignals(False)
+            self.update_time_labels()
+        finally:
+            self.time_group.setUpdatesEnabled(True)
+            
+    def schedule_preview_refresh(self, side):
+        """Mark a frame preview stale and (re)start the debounce timer"""
+        self.pending_preview_sides.add(side)
+        self.preview_timer.start(self.PREVIEW_DEBOUNCE_MS)
+        
+    def refresh_pending_previews(self):
+        """Refresh the size estimate and any stale frame previews now"""
+        self.preview_timer.stop()
+        if not self.pending_preview_sides:
+            return
+            
+        sides = self.pending_preview_sides
+        self.pending_preview_sides = set()
+        
         self.update_preview()
-        self.load_end_frame_preview()
+        if 'start' in sides:
+            self.load_start_frame_preview()
+        if 'end' in sides:
+            self.load_end_frame_preview()
         
     def jump_to_start(self):
         """Jump main player to start time"""
@@ -460,64 +635,246 @@ class GifExportDialog(QDialog):
         
     def load_start_frame_preview(self):
         """Load preview of start frame"""
-        if not self.video_path:
-            return
-            
-        pixmap = self.extract_frame_at_time(self.start_time)
-        if pixmap and not pixmap.isNull():
-            scaled_pixmap = pixmap.scaled(200, 112, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            self.start_frame_preview.setPixmap(scaled_pixmap)
-            self.start_frame_pixmap = pixmap
-        else:
-            self.start_frame_preview.setText("No Preview")
+        self.request_frame_preview('start', self.start_time)
             
     def load_end_frame_preview(self):
         """Load preview of end frame"""
+        self.request_frame_preview('end', self.end_time)
+        
+    def request_frame_preview(self, side, time_seconds):
+        """Decode the frame at time_seconds in the background for one side"""
         if not self.video_path:
             return
             
-        pixmap = self.extract_frame_at_time(self.end_time)
-        if pixmap and not pixmap.isNull():
-            scaled_pixmap = pixmap.scaled(200, 112, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            self.end_frame_preview.setPixmap(scaled_pixmap)
+        self.preview_request_ids[side] += 1
+        
+        key = (self.video_path, round(time_seconds * 10))
+        pixmap = self.preview_cache.get(key)
+        if pixmap is not None:
+            self.preview_cache.move_to_end(key)
+            self.show_frame_preview(side, pixmap)
+            return
+            
+        self.preview_request_keys[side] = key
+        worker = FrameExtractWorker(self.extract_frame_at_time, time_seconds,
+                                    side, self.preview_request_ids[side],
+                                    self.is_preview_request_stale)
+        worker.signals.finished.connect(self.on_frame_extracted, Qt.ConnectionType.QueuedConnection)
+        QThreadPool.globalInstance().start(worker)
+        
+    def is_preview_request_stale(self, side, request_id):
+        """Whether a newer preview request superseded this one (any thread)"""
+        return request_id != self.preview_request_ids[side]
+        
+    def on_frame_extracted(self, side, request_id, image):
+        """Show a decoded preview frame unless a newer one was requested"""
+        if self.is_preview_request_stale(side, request_id):
+            return
+            
+        if image.isNull():
+            self.show_frame_preview(side, None)
+            return
+            
+        pixmap = self.preview_pixmap(image)
+        
+        self.preview_cache[self.preview_request_keys[side]] = pixmap
+        if len(self.preview_cache) > self.PREVIEW_CACHE_SIZE:
+            self.preview_cache.popitem(last=False)
+            
+        self.show_frame_preview(side, pixmap)
+        
+    def preview_pixmap(self, image):
+        """Upload a decoded preview, tagged with the device pixel ratio it was sized for"""
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(self.preview_pixel_ratio)
+        return pixmap
+        
+    def show_frame_preview(self, side, pixmap):
+        """Display a scaled preview pixmap (or a placeholder) for one side"""
+        if side == 'start':
+            preview_label = self.start_frame_preview
+            self.start_frame_pixmap = pixmap
+        else:
+            preview_label = self.end_frame_preview
             self.end_frame_pixmap = pixmap
+            
+        if pixmap is not None:
+            preview_label.setPixmap(pixmap)
         else:
-            self.end_frame_preview.setText("No Preview")
+            preview_label.setText("No Preview")
             
-    def extract_frame_at_time(self, time_seconds):
-        """Extract frame at specific time"""
+    def extract_frame_at_time(self, time_seconds, cancelled=None):
+        """Extract frame at specific time as a detached QImage (thread-safe)"""
         try:
-            import cv2
-            from core.frame_manager import FrameManager
+            with QMutexLocker(self.preview_capture_mutex):
+                # Checked after the lock: a queued request may have been
+                # superseded while waiting for the shared capture
+                if self.preview_capture_closed or (cancelled and cancelled()):
+                    return QImage()
+                    
+                if self.preview_capture is None:
+                    self.preview_capture = cv2.VideoCapture(self.video_path)
+                    self.preview_fps = self.preview_capture.get(cv2.CAP_PROP_FPS)
+                    
+                cap = self.preview_capture
+                if not cap.isOpened():
+                    return QImage()
+                    
+                target_frame = int(time_seconds * self.preview_fps)
+                skip = target_frame - self.preview_next_frame
+                
+                if self.preview_next_frame >= 0 and 0 <= skip <= self.PREVIEW_FORWARD_GRAB_FRAMES:
+                    # Short step forward: decoding on is cheaper than seeking
+                    for _ in range(skip):
+                        cap.grab()
+                else:
+                    cap.set(cv2.CAP_PROP_POS_MSEC, time_seconds * 1000.0)
+                    
+                ret, frame = cap.read()
+                self.preview_next_frame = target_frame + 1 if ret and self.preview_fps > 0 else -1
+            
+            if ret:
+                return self.fit_preview_frame(frame)
+            return QImage()
             
-            cap = cv2.VideoCapture(self.video_path)
+        except Exception as e:
+            print(f"Error extracting frame: {e}")
+            return QImage()
+        
+    def fit_preview_frame(self, frame):
+        """Resize a decoded frame into a QImage fitting the preview labels in device pixels"""
+        height, width = frame.shape[:2]
+        ratio = self.preview_pixel_ratio
+        scale = min(self.PREVIEW_WIDTH * ratio / width, self.PREVIEW_HEIGHT * ratio / height)
+        
+        # Area averaging is the cheap, alias-free choice for downscaling
+        interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR
+        return self.frame_manager.resize_cv_to_qimage(
+            frame, max(1, int(width * scale)), max(1, int(height * scale)), interpolation)
+        
+    def precompute_preview_strip(self):
+        """Start decoding a sparse strip of previews into the preview cache"""
+        if not self.video_path or self.preview_capture_closed:
+            return
+            
+        step = max(1, int(self.duration_seconds / self.PREVIEW_STRIP_FRAMES))
+        times = [float(t) for t in range(0, int(self.duration_seconds), step)]
+        times = times[:self.PREVIEW_STRIP_FRAMES]
+        
+        worker = PreviewStripWorker(self.extract_preview_strip, times)
+        worker.signals.batch_ready.connect(self.on_preview_strip_ready, Qt.ConnectionType.QueuedConnection)
+        QThreadPool.globalInstance().start(worker)
+        
+    def extract_preview_strip(self, times):
+        """Yield batches of (time, QImage) decoded with a private capture"""
+        cap = cv2.VideoCapture(self.video_path)
+        try:
             if not cap.isOpened():
-                return None
+                return
                 
             fps = cap.get(cv2.CAP_PROP_FPS)
-            target_frame = int(time_seconds * fps)
-            
-            cap.set(cv2.CAP_PROP_POS_FRAMES, target_frame)
-            ret, frame = cap.read()
+            next_frame = -1  # frame the capture will read next
             
+            batch = []
+            for time_seconds in times:
+                if self.preview_capture_closed:
+                    return
+                    
+                # Times ascend, so stay inside the stream and grab() through
+                # the gap; grabbed frames skip retrieval and color conversion
+                target_frame = int(time_seconds * fps)
+                skip = target_frame - next_frame
+                if fps > 0 and next_frame >= 0 and 0 <= skip <= self.PREVIEW_STRIP_MAX_GRAB:
+                    for _ in range(skip):
+                        cap.grab()
+                else:
+                    cap.set(cv2.CAP_PROP_POS_MSEC, time_seconds * 1000.0)
+                    
+                ret, frame = cap.read()
+                if not ret:
+                    next_frame = -1
+                    continue
+                next_frame = target_frame + 1
+                    
+                image = self.fit_preview_frame(frame)
+                batch.append((time_seconds, image))
+                if len(batch) >= self.PREVIEW_STRIP_BATCH:
+                    yield batch
+                    batch = []
+                    
+            if batch:
+                yield batch
+                
+        except Exception as e:
+            logger.warning("Error precomputing preview strip: %s", e)
+        finally:
             cap.release()
             
-            if ret:
-                frame_manager = FrameManager()
-                return frame_manager.convert_cv_to_qt(frame)
-            return None
+    def on_preview_strip_ready(self, batch):
+        """Add precomputed previews to the cache without displacing newer ones"""
+        if self.preview_capture_closed:
+            return
             
-        except Exception as e:
-            print(f"Error extracting frame: {e}")
-            return None
+        for time_seconds, image in batch:
+            if len(self.preview_cache) >= self.PREVIEW_CACHE_SIZE:
+                return
+                
+            key = (self.video_path, round(time_seconds * 10))
+            if key in self.preview_cache or image.isNull():
+                continue
+                
+            # Least recently used end: evicted before anything actually shown
+            self.preview_cache[key] = self.preview_pixmap(image)
+            self.preview_cache.move_to_end(key, last=False)
+                
+    def release_preview_capture(self):
+        """Release the shared preview capture (waits for a running extraction)"""
+        with QMutexLocker(self.preview_capture_mutex):
+            self.preview_capture_closed = True
+            if self.preview_capture is not None:
+                self.preview_capture.release()
+                self.preview_capture = None
+                
+    def done(self, result):
+        """Stop background work and release frames on accept, reject or close"""
+        self.preview_timer.stop()
+        
+        # A cancelled or closed dialog must not leave an export running
+        if self.gif_exporter.isRunning():
+            # A cancelled export may still finish normally; nothing from it
+            # may reach the closed dialog (or report success)
+            self.gif_exporter.progress_updated.disconnect()
+            self.gif_exporter.export_finished.disconnect()
+            self.gif_exporter.export_failed.disconnect()
+            self.gif_exporter.cancel()
+            
+            if not self.gif_exporter.wait(200):
+                # MoviePy can't be interrupted: hand the thread to the
+                # application so it isn't destroyed with the dialog while
+                # running, and delete it once it has stopped
+                self.gif_exporter.setParent(QApplication.instance())
+                self.gif_exporter.finished.connect(self.gif_exporter.deleteLater)
+            
+        self.release_preview_capture()
+        self.preview_cache.clear()
+        self.start_frame_pixmap = None
+        self.end_frame_pixmap = None
+        super().done(result)
         
     def update_time_labels(self):
         """Update time display labels"""
-        self.start_time_label.setText(self.format_time(self.start_time))
-        self.end_time_label.setText(self.format_time(self.end_time))
-        
         duration = self.end_time - self.start_time
-        self.duration_label.setText(f"Duration: {duration:.1f} seconds")
+        texts = (self.format_time(self.start_time), self.format_time(self.end_time),
+                 f"Duration: {duration:.1f} seconds")
+        
+        last_start, last_end, last_duration = self.time_label_texts
+        if texts[0] != last_start:
+            self.start_time_label.setText(texts[0])
+        if texts[1] != last_end:
+            self.end_time_label.setText(texts[1])
+        if texts[2] != last_duration:
+            self.duration_label.setText(texts[2])
+        self.time_label_texts = texts
         
     def update_preview(self):
         """Update preview and size estimation"""
@@ -530,8 +887,15 @@ class GifExportDialog(QDialog):
         # Get export settings
         width, height = self.get_export_dimensions()
         fps = self.fps_spin.value()
+        quality = self.quality_combo.currentText()
         duration = self.end_time - self.start_time
         
+        # Nothing the estimate depends on has changed
+        preview_key = (self.start_time, self.end_time, fps, width, height, quality)
+        if preview_key == self.last_preview_key:
+            return
+        self.last_preview_key = preview_key
+        
         # Duration warnings
         if duration > 30:
             self.duration_warning_label.setText("⚠️ Warning: GIFs longer than 30 seconds may be very large!")
@@ -542,50 +906,44 @@ class GifExportDialog(QDialog):
         else:
             self.duration_warning_label.setVisible(False)
         
-        # Estimate file size
-        estimated_size = self.gif_exporter.get_estimated_size(
-            self.video_path, self.start_time, self.end_time, fps, width, height
-        )
+        # Estimate file size from the cached per-second rate
+        key = (fps, width, height, quality)
+        rate = self.size_rate_cache.get(key)
+        if rate is None:
+            rate = self.gif_exporter.get_estimated_size(self.video_path, 0, 1, fps, width, height)
+            self.size_rate_cache[key] = rate
+        estimated_size = int(rate * duration)
         
         size_text = self.gif_exporter.format_file_size(estimated_size)
-        self.size_estimate_label.setText(f"Estimated file size: {size_text}")
         
         # Add quality recommendation
         if estimated_size > 50 * 1024 * 1024:  # 50MB
             self.size_estimate_label.setText(f"Estimated file size: {size_text} (Very Large! Consider reducing duration, size, or FPS)")
-            self.size_estimate_label.setStyleSheet("color: #ff4444; font-weight: bold;")
+            style = "color: #ff4444; font-weight: bold;"
         elif estimated_size > 10 * 1024 * 1024:  # 10MB
             self.size_estimate_label.setText(f"Estimated file size: {size_text} (Large file - consider optimization)")
-            self.size_estimate_label.setStyleSheet("color: #ff8800; font-weight: bold;")
+            style = "color: #ff8800; font-weight: bold;"
         else:
-            self.size_estimate_label.setStyleSheet("color: #00ff00; font-weight: bold;")
+            self.size_estimate_label.setText(f"Estimated file size: {size_text}")
+            style = "color: #00ff00; font-weight: bold;"
+            
+        # Re-applying a stylesheet re-polishes the label, so only do it on change
+        if style != self.size_estimate_style:
+            self.size_estimate_label.setStyleSheet(style)
+            self.size_estimate_style = style
         
     def get_export_dimensions(self):
         """Get export dimensions based on size setting"""
-        size_text = self.size_combo.currentText()
-        
-        if "320x180" in size_text:
-            return 320, 180
-        elif "480x270" in size_text:
-            return 480, 270
-        elif "640x360" in size_text:
-            return 640, 360
-        elif "960x540" in size_text:
-            return 960, 540
-        else:  # Original size
+        dimensions = self.size_combo.currentData()
+        if dimensions is None:  # Original size
             # TODO: Get original video dimensions
             return 640, 360
+        return dimensions
             
     def get_quality_setting(self):
         """Get quality setting"""
-        quality_text = self.quality_combo.currentText()
-        
-        if "Low" in quality_text:
-            return 70
-        elif "Medium" in quality_text:
-            return 85
-        else:  # High
-            return 95
+        quality = self.quality_combo.currentData()
+        return quality if quality is not None else 85
             
     def start_export(self):
         """Start the GIF export process"""
@@ -656,6 +1014,9 @@ class GifExportDialog(QDialog):
         
     def format_time(self, seconds):
         """Format seconds as mm:ss"""
+        if 0 <= seconds < len(self.time_texts):
+            return self.time_texts[int(seconds)]
+            
         minutes = int(seconds // 60)
         seconds = int(seconds % 60)
         return f"{minutes:02d}:{seconds:02d}"
\ No newline at end of file
@@ -3,170 +3,365 @@
 import sys
 import os
 import json
-import cv2
+import time
+import logging
+from collections import deque
+from functools import partial
 from pathlib import Path
-from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
+from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
                              QLabel, QPushButton, QSlider, QFrame, QSizePolicy,
-                             QApplication, QFileDialog, QGraphicsDropShadowEffect,
+                             QApplication, QFileDialog,
                              QMessageBox, QDialog)
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtSignal, QSize
-from PyQt6.QtGui import QIcon, QFont, QPixmap, QPainter, QColor, QPen, QBrush
+from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtSignal, QSize, QRectF
+from PyQt6.QtGui import QIcon, QFont, QPixmap, QPixmapCache, QPainter, QColor, QPen, QBrush
 
 # Import our video engine
 from src.core.video_player import VideoPlayerEngine
-from src.core.frame_manager import FrameManager
 from .export_dialog import GifExportDialog
 
-class VideoWidget(QLabel):
+logger = logging.getLogger(__name__)
+
+class VideoWidget(QWidget):
     """Custom video display widget (original design)"""
     
     # Signal to communicate with main window
     file_dropped = pyqtSignal(str)
+    display_size_changed = pyqtSignal(int, int)  # Drawable size in device pixels
+    
+    # Quiet time after the last resize before the new size is published
+    DISPLAY_SIZE_DEBOUNCE_MS = 100
+    
+    # Frames are drawn with fast scaling while they keep arriving; when not
+    # playing, this long after the last one the frame is redrawn with smooth
+    # scaling (during playback it would only refine frames about to be replaced)
+    SMOOTH_REDRAW_DELAY_MS = 150
+    
+    PLACEHOLDER_TEXT = "Use File → Open Video... to load a video"
+    
+    # Fallback repaint rate when the screen does not report one
+    DEFAULT_REFRESH_RATE = 60.0
+    
+    # The repaint interval is re-derived this often from recent frame paint
+    # times, so a slow paint path lowers the repaint rate instead of queueing
+    # paints it cannot finish; the headroom leaves the event loop some slack
+    REPAINT_ADAPT_INTERVAL_S = 1.0
+    PAINT_TIME_SAMPLES = 300
+    PAINT_TIME_HEADROOM = 1.25
+    
+    # Smooth-scaled copies of a still frame are kept in QPixmapCache, so
+    # repaints while paused (overlay moves, expose events) are plain blits
+    SCALED_FRAME_CACHE_KB = 64 * 1024
     
     def __init__(self):
         super().__init__()
         self.setMinimumSize(800, 450)
-        self.setStyleSheet("""
-            QLabel {
-                background-color: #000000;
-                border: none;
-            }
-        """)
-        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setAcceptDrops(True)
         
-        # Ensure widget can receive mouse events
-        self.setMouseTracking(True)
-        self.setAttribute(Qt.WidgetAttribute.WA_Hover, True)
+        # Current frame as emitted by the player (RGB32), drawn scaled in
+        # paintEvent. It shares pixels with one of the player's ring slots; the
+        # player detaches the slot before decoding into it again, so this
+        # image never changes under the GUI
+        self.frame_image = None
+        self.frame_serial = 0  # Bumped per frame; ring slots reuse QImages
+        
+        # Aspect-fit rectangle for the current frame size, recomputed only on
+        # resize or when the frame size changes. frame_fits is set when the
+        # player already sized the frame for this widget: it is then drawn
+        # 1:1 in device pixels and never needs (smooth) rescaling
+        self.target_rect = QRectF()
+        self.target_frame_size = None
+        self.frame_fits = False
+        self.smooth_scaling = True
+        self.playing = False
+        self.smooth_redraw_timer = QTimer(self)
+        self.smooth_redraw_timer.setSingleShot(True)
+        self.smooth_redraw_timer.timeout.connect(self.redraw_smooth)
+        
+        # Frames only replace frame_image; repaints run on this timer at the
+        # display refresh rate, so a frame that is superseded before the next
+        # tick is simply never painted. The timer stops while no frames arrive
+        self.frame_dirty = False
+        self.repaint_timer = QTimer(self)
+        self.repaint_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.repaint_timer.timeout.connect(self.repaint_if_dirty)
+        self.paint_times = deque(maxlen=self.PAINT_TIME_SAMPLES)  # seconds per frame paint
+        self.last_repaint_adapt = 0.0
+        
+        # The player shrinks frames to this widget's size before emitting them
+        self.display_size_timer = QTimer(self)
+        self.display_size_timer.setSingleShot(True)
+        self.display_size_timer.timeout.connect(self.publish_display_size)
+        
+        # Font for the placeholder text
+        self.placeholder_font = QFont("Segoe UI", 14)
+        self.placeholder_font.setWeight(QFont.Weight.Light)
+        
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), self.SCALED_FRAME_CACHE_KB))
+        
+        # paintEvent covers every pixel, so Qt need not erase first
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAcceptDrops(True)
         
-        # Initialize with placeholder
-        self.show_placeholder()
+        # No mouse tracking or WA_Hover: only presses and drops are handled,
+        # which are delivered without them, so plain mouse movement over the
+        # video generates no move or hover events
         
-        print("VideoWidget initialized with drag/drop and mouse tracking")  # Debug
+        logger.debug("VideoWidget initialized with drag/drop")
         
     def show_placeholder(self):
         """Show placeholder text"""
-        self.setText("Use File → Open Video... to load a video")
-        
-        # Set font for the placeholder text
-        font = QFont("Segoe UI", 14)
-        font.setWeight(QFont.Weight.Light)
-        self.setFont(font)
-        
-        # Style the placeholder text
-        self.setStyleSheet("""
-            QLabel {
-                background-color: #000000;
-                border: none;
-                color: #666666;
-            }
-        """)
-        
-    def display_frame(self, pixmap):
-        """Display a video frame"""
-        if pixmap and not pixmap.isNull():
-            # Scale to fit widget while maintaining aspect ratio
-            scaled_pixmap = pixmap.scaled(
-                self.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            self.setPixmap(scaled_pixmap)
-            
-            # Update stylesheet to remove placeholder styling
-            self.setStyleSheet("""
-                QLabel {
-                    background-color: #000000;
-                    border: none;
-                }
-            """)
+        self.frame_image = None
+        self.update()
+        
+    def display_frame(self, image):
+        """Display a video frame (QImage)"""
+        if image and not image.isNull():
+            # No per-frame scaled() copy or pixmap upload: paintEvent draws the
+            # image scaled in a single drawImage call
+            self.frame_image = image
+            self.frame_serial += 1
+            if image.size() != self.target_frame_size:
+                self.update_target_rect()
+            self.smooth_scaling = False
+            if not self.playing:
+                self.smooth_redraw_timer.start(self.SMOOTH_REDRAW_DELAY_MS)
+            
+            self.frame_dirty = True
+            if not self.repaint_timer.isActive():
+                self.repaint_timer.start(self.refresh_interval_ms())
         else:
             self.show_placeholder()
+            
+    def set_playing(self, playing):
+        """Keep fast scaling while playing; refine the still frame once paused"""
+        self.playing = playing
+        if playing:
+            self.smooth_redraw_timer.stop()
+        elif self.frame_image is not None and not self.smooth_scaling:
+            self.smooth_redraw_timer.start(self.SMOOTH_REDRAW_DELAY_MS)
+            
+    def refresh_interval_ms(self):
+        """Repaint interval: the screen's refresh rate, or slower if painting can't keep up"""
+        screen = self.screen()
+        rate = screen.refreshRate() if screen is not None else 0
+        if rate <= 0:
+            rate = self.DEFAULT_REFRESH_RATE
+        interval = 1000 / rate
+        
+        if self.paint_times:
+            predicted_ms = sum(self.paint_times) / len(self.paint_times) * 1000
+            interval = max(interval, predicted_ms * self.PAINT_TIME_HEADROOM)
+        return max(1, int(interval))
+        
+    def repaint_if_dirty(self):
+        """Repaint-timer tick: schedule a paint only if a new frame arrived"""
+        now = time.perf_counter()
+        if now - self.last_repaint_adapt >= self.REPAINT_ADAPT_INTERVAL_S:
+            self.last_repaint_adapt = now
+            interval = self.refresh_interval_ms()
+            if interval != self.repaint_timer.interval():
+                self.repaint_timer.setInterval(interval)
+                
+        if self.frame_dirty:
+            self.frame_dirty = False
+            self.update()
+        else:
+            self.repaint_timer.stop()
+            
+    def resizeEvent(self, event):
+        """Publish the new drawable size once resizing settles"""
+        super().resizeEvent(event)
+        self.update_target_rect()
+        self.display_size_timer.start(self.DISPLAY_SIZE_DEBOUNCE_MS)
+        
+    def update_target_rect(self):
+        """Fit the current frame to the widget, keeping aspect ratio, centered"""
+        if self.frame_image is None:
+            self.target_frame_size = None
+            return
+        self.target_frame_size = self.frame_image.size()
+        size = self.target_frame_size.scaled(self.size(), Qt.AspectRatioMode.KeepAspectRatio)
+        
+        # The player's fit rounds independently; within a pixel, keep the
+        # frame's own size so the painter blits instead of resampling
+        ratio = self.devicePixelRatioF()
+        width = self.target_frame_size.width() / ratio
+        height = self.target_frame_size.height() / ratio
+        self.frame_fits = abs(width - size.width()) <= 1 and abs(height - size.height()) <= 1
+        if not self.frame_fits:
+            width, height = size.width(), size.height()
+            
+        self.target_rect = QRectF(0, 0, width, height)
+        self.target_rect.moveCenter(QRectF(self.rect()).center())
+        
+    def publish_display_size(self):
+        """Emit the widget size in device pixels"""
+        ratio = self.devicePixelRatioF()
+        self.display_size_changed.emit(int(self.width() * ratio), int(self.height() * ratio))
+        
+    def redraw_smooth(self):
+        """Redraw the current frame with smooth scaling once frames stop arriving"""
+        self.smooth_scaling = True
+        if not self.frame_fits:
+            self.update()
+        
+    def scaled_frame_pixmap(self, size):
+        """Smooth-scaled pixmap of the current frame, cached per frame and size"""
+        ratio = self.devicePixelRatioF()
+        width, height = round(size.width() * ratio), round(size.height() * ratio)
+        key = f"videoFrame_{self.frame_serial}_{width}x{height}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QPixmap.fromImage(self.frame_image.scaled(
+                width, height,
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.SmoothTransformation))
+            pixmap.setDevicePixelRatio(ratio)
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+        
+    def paintEvent(self, event):
+        """Draw the current frame scaled to fit, or the placeholder text"""
+        paint_start = time.perf_counter()
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), Qt.GlobalColor.black)
+        
+        if self.frame_image is None:
+            painter.setFont(self.placeholder_font)
+            painter.setPen(QColor("#666666"))
+            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self.PLACEHOLDER_TEXT)
+        else:
+            if self.smooth_scaling and not self.frame_fits:
+                painter.drawPixmap(self.target_rect.topLeft(), self.scaled_frame_pixmap(self.target_rect.size()))
+            else:
+                painter.drawImage(self.target_rect, self.frame_image)
+            
+        painter.end()
+        
+        if self.frame_image is not None:
+            self.paint_times.append(time.perf_counter() - paint_start)
     
     def dragEnterEvent(self, event):
-        print("Drag enter event")  # Debug
+        logger.debug("Drag enter event")
         if event.mimeData().hasUrls():
-            print("Accepting drag event")  # Debug
+            logger.debug("Accepting drag event")
             event.acceptProposedAction()
     
     def dropEvent(self, event):
-        print("Drop event triggered")  # Debug
+        logger.debug("Drop event triggered")
         files = [url.toLocalFile() for url in event.mimeData().urls()]
-        print(f"Dropped files: {files}")  # Debug
+        logger.debug("Dropped files: %s", files)
         if files:
             # Emit signal with the file path
             self.file_dropped.emit(files[0])
             
     def mousePressEvent(self, event):
         """Handle mouse clicks to open file dialog"""
-        print("Mouse press event on video widget")  # Debug
-        if event.button() == Qt.MouseButton.LeftButton:
-            print("Left mouse button clicked")  # Debug
+        logger.debug("Mouse press event on video widget")
+        # Only the empty placeholder opens the dialog; clicks on a loaded
+        # video must not interrupt playback
+        if event.button() == Qt.MouseButton.LeftButton and self.frame_image is None:
+            logger.debug("Left mouse button clicked")
             self.file_dropped.emit("")  # Empty string signals to open dialog
 
+# Sizes ModernButton is used at; each gets a round border-radius rule
+MODERN_BUTTON_SIZES = (40, 42, 45, 50)
+
+# Control bar stylesheet, applied once on ControlsWidget so Qt parses it a
+# single time; widgets pick their rules by type and object name
+CONTROLS_STYLE = """
+    * {
+        background-color: transparent;
+    }
+    QFrame#timelineFrame {
+        background-color: rgba(30, 30, 30, 0.9);
+        border-radius: 8px;
+        padding: 15px;
+    }
+    QFrame#timelineFrame QLabel#timeLabel {
+        background-color: rgba(30, 30, 30, 0.9);
+        border-radius: 8px;
+        padding: 15px;
+        color: white;
+        font-size: 16px;
+        font-weight: 600;
+        min-width: 140px;
+    }
+    QPushButton {
+        background-color: rgba(45, 45, 45, 0.8);
+        border: none;
+        border-bottom: 2px solid rgba(0, 0, 0, 0.31);
+        color: white;
+        font-size: 14px;
+        font-weight: 500;
+    }
+    QPushButton:hover {
+        background-color: rgba(0, 120, 212, 0.9);
+        border: 2px solid rgba(0, 120, 212, 0.5);
+    }
+    QPushButton:pressed {
+        background-color: rgba(0, 120, 212, 1.0);
+    }
+""" + "".join(f"""
+    QPushButton#modernButton{size} {{
+        border-radius: {size // 2}px;
+    }}
+""" for size in MODERN_BUTTON_SIZES) + """
+    QPushButton#exportGifButton {
+        background-color: rgba(255, 165, 0, 0.8);
+        border: none;
+        border-bottom: 2px solid rgba(0, 0, 0, 0.31);
+        border-radius: 22px;
+        color: white;
+        font-size: 13px;
+        font-weight: bold;
+    }
+    QPushButton#exportGifButton:hover {
+        background-color: rgba(255, 165, 0, 1.0);
+    }
+    QPushButton#exportGifButton:disabled {
+        background-color: rgba(100, 100, 100, 0.5);
+        color: rgba(255, 255, 255, 0.3);
+    }
+    QSlider::groove:horizontal {
+        border: none;
+        height: 6px;
+        background: rgba(255, 255, 255, 0.3);
+        border-radius: 3px;
+    }
+    QSlider::handle:horizontal {
+        background: #0078d4;
+        border: 2px solid #ffffff;
+        width: 18px;
+        height: 18px;
+        border-radius: 9px;
+        margin: -6px 0;
+    }
+    QSlider::handle:horizontal:hover {
+        background: #106ebe;
+        width: 22px;
+        height: 22px;
+        border-radius: 11px;
+        margin: -8px 0;
+    }
+    QSlider::sub-page:horizontal {
+        background: #0078d4;
+        border-radius: 3px;
+    }
+"""
+
 class ModernButton(QPushButton):
-    """Modern styled button with hover effects"""
+    """Modern styled button with hover effects (styled by CONTROLS_STYLE)"""
     
     def __init__(self, text="", icon_path=None, size=40):
         super().__init__(text)
         self.setFixedSize(size, size)
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: rgba(45, 45, 45, 0.8);
-                border: none;
-                border-radius: {size//2}px;
-                color: white;
-                font-size: 14px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(0, 120, 212, 0.9);
-                border: 2px solid rgba(0, 120, 212, 0.5);
-            }}
-            QPushButton:pressed {{
-                background-color: rgba(0, 120, 212, 1.0);
-            }}
-        """)
-        
-        # Add subtle shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(10)
-        shadow.setColor(QColor(0, 0, 0, 80))
-        shadow.setOffset(0, 2)
-        self.setGraphicsEffect(shadow)
+        self.setObjectName(f"modernButton{size}")
 
 class ClickableSlider(QSlider):
-    """Enhanced slider with click-to-seek and smooth real-time seeking"""
+    """Enhanced slider with click-to-seek and smooth real-time seeking (styled by CONTROLS_STYLE)"""
     
     def __init__(self, orientation=Qt.Orientation.Horizontal):
         super().__init__(orientation)
-        self.setStyleSheet("""
-            QSlider::groove:horizontal {
-                border: none;
-                height: 6px;
-                background: rgba(255, 255, 255, 0.3);
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background: #0078d4;
-                border: 2px solid #ffffff;
-                width: 18px;
-                height: 18px;
-                border-radius: 9px;
-                margin: -6px 0;
-            }
-            QSlider::handle:horizontal:hover {
-                background: #106ebe;
-                width: 22px;
-                height: 22px;
-                border-radius: 11px;
-                margin: -8px 0;
-            }
-            QSlider::sub-page:horizontal {
-                background: #0078d4;
-                border-radius: 3px;
-            }
-        """)
         
     def mousePressEvent(self, event):
         """Handle mouse press - allow clicking anywhere on slider"""
@@ -185,7 +380,7 @@ class ClickableSlider(QSlider):
                 new_value = int(self.minimum() + percentage * (self.maximum() - self.minimum()))
                 new_value = max(self.minimum(), min(self.maximum(), new_value))
                 
-                print(f"Slider clicked: pos={click_pos:.1f}, width={usable_width}, percentage={percentage:.3f}, value={new_value}")  # Debug
+                logger.debug("Slider clicked: pos=%.1f, width=%s, percentage=%.3f, value=%s", click_pos, usable_width, percentage, new_value)
                 
                 # Set the new value (this will trigger valueChanged signal)
                 self.setValue(new_value)
@@ -201,15 +396,24 @@ class TimelineSlider(ClickableSlider):
         self.gif_start_pos = 0  # Position 0-1000 for start marker
         self.gif_end_pos = 100   # Position 0-1000 for end marker
         self.show_markers = False
+        self.marker_cache = None  # Rendered markers, rebuilt when they change
         self.setMinimumHeight(20)  # Slightly taller for markers
         
     def set_gif_markers(self, start_pos, end_pos, show=True):
         """Set GIF start/end marker positions (0-1000 range)"""
+        if (start_pos, end_pos, show) == (self.gif_start_pos, self.gif_end_pos, self.show_markers):
+            return
         self.gif_start_pos = start_pos
         self.gif_end_pos = end_pos
         self.show_markers = show
+        self.marker_cache = None
         self.update()  # Trigger repaint
         
+    def resizeEvent(self, event):
+        """Marker positions depend on the width, so the overlay is redrawn"""
+        super().resizeEvent(event)
+        self.marker_cache = None
+        
     def paintEvent(self, event):
         """Custom paint to draw markers"""
         # Draw the normal slider first
@@ -218,7 +422,23 @@ class TimelineSlider(ClickableSlider):
         if not self.show_markers:
             return
             
+        # The slider repaints on every position update; the markers only
+        # change in set_gif_markers, so they are blitted from a cached overlay
+        if self.marker_cache is None:
+            self.marker_cache = self.render_markers()
+            
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self.marker_cache)
+        painter.end()
+        
+    def render_markers(self):
+        """Draw the GIF markers into a transparent widget-sized pixmap"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Calculate marker positions
@@ -252,28 +472,41 @@ class TimelineSlider(ClickableSlider):
             painter.setPen(Qt.PenStyle.NoPen)
             painter.setBrush(QBrush(QColor(255, 165, 0, 30)))  # Orange with transparency
             painter.drawRect(int(start_x), 6, int(end_x - start_x), 8)
+            
+        painter.end()
+        return pixmap
 
 class ControlsWidget(QWidget):
     """Controls widget with improved timeline handling"""
     
     play_pause_clicked = pyqtSignal()
     stop_clicked = pyqtSignal()
-    seek_requested = pyqtSignal(int)  # Position in ms
+    seek_requested = pyqtSignal(int, bool)  # Position in ms, exact (False while dragging)
     frame_step_requested = pyqtSignal(int)  # -1 for previous, 1 for next
     volume_changed = pyqtSignal(int)
     export_gif_requested = pyqtSignal()  # GIF export requested
     
+    # A drag seek is treated as done if the player has not reported back by then
+    SEEK_TIMEOUT_MS = 250
+    
     def __init__(self):
         super().__init__()
         self.is_playing = False
         self.duration_ms = 0
         self.position_ms = 0
+        # "mm:ss" for every whole second of the video (built per duration),
+        # and the text the time label shows, so ticks within a second skip it
+        self.time_texts = []
+        self.time_label_text = "00:00 / 00:00"
         self.is_seeking = False  # Track if user is actively seeking
-        self.seek_timer = QTimer()  # Timer for throttled seeking
+        # While dragging, at most one seek is in flight; the newest slider
+        # position is sent when the player reports it finished the last one
+        self.seek_in_flight = False
+        self.seek_timer = QTimer()  # Watchdog for a seek that never completes
         self.seek_timer.setSingleShot(True)
-        self.seek_timer.timeout.connect(self.perform_seek)
+        self.seek_timer.timeout.connect(self.on_seek_completed)
         self.pending_seek_position = 0
-        self.last_seek_time = 0  # Track when we last sent a seek request
+        self.last_seek_position = None  # Last drag position sent to the player
         # FIXED: Add flag to track if position updates should be processed
         self.accept_position_updates = True
         self.setup_ui()
@@ -284,18 +517,9 @@ class ControlsWidget(QWidget):
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(10)
         
-        # Spacer to push controls to bottom
-        layout.addStretch()
-        
         # Timeline container
         timeline_frame = QFrame()
-        timeline_frame.setStyleSheet("""
-            QFrame {
-                background-color: rgba(30, 30, 30, 0.9);
-                border-radius: 8px;
-                padding: 15px;
-            }
-        """)
+        timeline_frame.setObjectName("timelineFrame")
         
         timeline_layout = QVBoxLayout(timeline_frame)
         timeline_layout.setSpacing(15)
@@ -305,7 +529,10 @@ class ControlsWidget(QWidget):
         self.progress_slider.setMaximum(1000)  # Higher resolution for smoother seeking
         self.progress_slider.sliderPressed.connect(self.on_slider_pressed)
         self.progress_slider.sliderReleased.connect(self.on_slider_released)
-        self.progress_slider.valueChanged.connect(self.on_slider_value_changed)
+        # Drags report through sliderMoved; valueChanged would also fire for
+        # every programmatic setValue from playback position updates
+        self.progress_slider.setTracking(False)
+        self.progress_slider.sliderMoved.connect(self.on_slider_value_changed)
         timeline_layout.addWidget(self.progress_slider)
         
         # Controls row
@@ -328,9 +555,9 @@ class ControlsWidget(QWidget):
         
         # Frame navigation buttons
         self.prev_frame_btn = ModernButton("⏮", size=42)  # Slightly larger
-        self.prev_frame_btn.clicked.connect(lambda: self.on_frame_step_clicked(-1))
+        self.prev_frame_btn.clicked.connect(self.on_previous_frame_clicked)
         self.next_frame_btn = ModernButton("⏭", size=42)  # Slightly larger
-        self.next_frame_btn.clicked.connect(lambda: self.on_frame_step_clicked(1))
+        self.next_frame_btn.clicked.connect(self.on_next_frame_clicked)
         left_controls.addWidget(self.prev_frame_btn)
         left_controls.addWidget(self.next_frame_btn)
         
@@ -338,15 +565,7 @@ class ControlsWidget(QWidget):
         
         # Center - Time display
         self.time_label = QLabel("00:00 / 00:00")
-        self.time_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 16px;
-                font-weight: 600;
-                min-width: 140px;
-                text-align: center;
-            }
-        """)
+        self.time_label.setObjectName("timeLabel")
         self.time_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         controls_layout.addWidget(self.time_label)
         
@@ -373,23 +592,7 @@ class ControlsWidget(QWidget):
         
         # GIF export button
         self.export_btn = ModernButton("GIF", size=45)  # Slightly larger
-        self.export_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(255, 165, 0, 0.8);
-                border: none;
-                border-radius: 22px;
-                color: white;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 165, 0, 1.0);
-            }
-            QPushButton:disabled {
-                background-color: rgba(100, 100, 100, 0.5);
-                color: rgba(255, 255, 255, 0.3);
-            }
-        """)
+        self.export_btn.setObjectName("exportGifButton")
         self.export_btn.clicked.connect(self.on_export_gif_clicked)
         right_controls.addWidget(self.export_btn)
         
@@ -404,37 +607,46 @@ class ControlsWidget(QWidget):
         
         self.setLayout(layout)
         
-        # Set initial background to transparent (like original overlay)
-        self.setStyleSheet("background-color: transparent;")
+        # Transparent background (like original overlay) plus all control
+        # styling, parsed once for the whole bar
+        self.setStyleSheet(CONTROLS_STYLE)
         
         # Initialize export button as disabled
         self.update_export_button(False)
         
     def toggle_play_pause(self):
         """Toggle play/pause state - communicate with main window only"""
-        print("Play button clicked")  # Debug
+        logger.debug("Play button clicked")
         
         # Don't change state here - let the main window handle it
         # Just emit the signal and let main window decide the action
-        print(f"Current controls state before signal: {self.is_playing}")  # Debug
+        logger.debug("Current controls state before signal: %s", self.is_playing)
         self.play_pause_clicked.emit()
         
     def on_stop_clicked(self):
         """Handle stop button click"""
-        print("Stop button clicked")  # Debug
+        logger.debug("Stop button clicked")
         self.is_playing = False
         self.play_btn.setText("▶")
         self.stop_clicked.emit()
         
     def on_frame_step_clicked(self, direction):
         """Handle frame step button clicks"""
-        print(f"Frame step button clicked: {direction}")  # Debug
+        logger.debug("Frame step button clicked: %s", direction)
         # Use the same signal as keyboard for consistency
         self.frame_step_requested.emit(direction)
         
+    def on_previous_frame_clicked(self):
+        """Step back one frame"""
+        self.on_frame_step_clicked(-1)
+        
+    def on_next_frame_clicked(self):
+        """Step forward one frame"""
+        self.on_frame_step_clicked(1)
+        
     def on_export_gif_clicked(self):
         """Handle GIF export button click"""
-        print("GIF export button clicked")  # Debug
+        logger.debug("GIF export button clicked")
         self.export_gif_requested.emit()
         
     def toggle_mute(self):
@@ -473,6 +685,10 @@ class ControlsWidget(QWidget):
         
     def update_export_button(self, enabled=True):
         """Update export button state"""
+        # Called on every load/reset; re-setting the same state would still
+        # re-polish the button and rebuild its tooltip
+        if self.export_btn.toolTip() and self.export_btn.isEnabled() == enabled:
+            return
         self.export_btn.setEnabled(enabled)
         if enabled:
             self.export_btn.setToolTip("Export current segment as GIF")
@@ -481,23 +697,35 @@ class ControlsWidget(QWidget):
         
     def on_slider_pressed(self):
         """Handle when user starts seeking"""
-        print("User started seeking")  # Debug
+        logger.debug("User started seeking")
         self.is_seeking = True
+        self.seek_in_flight = False
+        self.last_seek_position = None
+        
+        # A groove click jumps the slider without a sliderMoved
+        if self.duration_ms > 0:
+            self.update_time_display(self.slider_position_ms(), self.duration_ms)
         
     def on_slider_released(self):
         """Handle when user finishes seeking"""
-        print("User finished seeking")  # Debug
+        logger.debug("User finished seeking")
         self.is_seeking = False
         
         # Stop the timer and perform final seek
         self.seek_timer.stop()
+        self.seek_in_flight = False
         
-        # Perform final precise seek
+        # Perform final precise seek. Without tracking, value() only catches up
+        # with the handle after sliderReleased, so read the slider position
         if self.duration_ms > 0:
-            final_position_ms = int((self.progress_slider.value() / 1000.0) * self.duration_ms)
-            print(f"Final seek to: {final_position_ms}ms")  # Debug
-            self.seek_requested.emit(final_position_ms)
+            final_position_ms = self.slider_position_ms()
+            logger.debug("Final seek to: %sms", final_position_ms)
+            self.seek_requested.emit(final_position_ms, True)
             
+    def slider_position_ms(self):
+        """Media position under the slider handle"""
+        return int((self.progress_slider.sliderPosition() / 1000.0) * self.duration_ms)
+        
     def on_slider_value_changed(self, value):
         """Handle slider value changes with improved throttling and crash protection"""
         if self.duration_ms > 0:
@@ -506,66 +734,63 @@ class ControlsWidget(QWidget):
             # Always update time display immediately for responsive UI
             self.update_time_display(position_ms, self.duration_ms)
             
-            # If user is seeking, throttle the actual video seeks
+            # If user is seeking, only the latest position is kept; it goes
+            # out now if the player is idle, else when the current seek is done
             if self.is_seeking:
-                import time
-                current_time = time.time()
-                
-                # Store the pending seek position
                 self.pending_seek_position = position_ms
-                
-                # More aggressive throttling to prevent crashes
-                if current_time - self.last_seek_time > 0.15:  # 150ms throttle (increased)
-                    self.seek_timer.stop()  # Stop existing timer
-                    self.seek_timer.start(100)  # Start new timer (100ms delay, increased)
+                if not self.seek_in_flight:
+                    self.perform_seek()
                     
+    def on_seek_completed(self):
+        """The player finished a seek: send the newest drag position, if it moved"""
+        self.seek_timer.stop()
+        self.seek_in_flight = False
+        if self.is_seeking and self.pending_seek_position != self.last_seek_position:
+            self.perform_seek()
+            
     def perform_seek(self):
-        """Perform the actual seek operation (throttled with crash protection)"""
+        """Perform the actual seek operation (one in flight, with crash protection)"""
         if self.is_seeking:
-            import time
-            current_time = time.time()
-            
             # Extra protection - don't seek if video player is busy
             try:
                 # Check if we have a valid position to seek to
                 if self.pending_seek_position < 0 or self.pending_seek_position > self.duration_ms:
-                    print(f"Invalid seek position: {self.pending_seek_position}ms")  # Debug
+                    logger.debug("Invalid seek position: %sms", self.pending_seek_position)
                     return
                     
-                self.last_seek_time = current_time
-                print(f"Throttled seek to: {self.pending_seek_position}ms")  # Debug
-                self.seek_requested.emit(self.pending_seek_position)
+                self.seek_in_flight = True
+                self.last_seek_position = self.pending_seek_position
+                self.seek_timer.start(self.SEEK_TIMEOUT_MS)
+                logger.debug("Drag seek to: %sms", self.pending_seek_position)
+                # Fast preview while dragging; release sends the exact seek
+                self.seek_requested.emit(self.pending_seek_position, False)
                 
             except Exception as e:
-                print(f"Error during seek: {e}")  # Debug
+                logger.warning("Error during seek: %s", e)
     
     def update_position(self, position_ms):
         """FIXED: Update position from video player with better state handling"""
-        print(f"Position update received: {position_ms}ms, accept_updates: {self.accept_position_updates}")  # Debug
+        logger.debug("Position update received: %sms, accept_updates: %s", position_ms, self.accept_position_updates)
         
         # FIXED: Only accept position updates when we should
         if not self.accept_position_updates:
-            print(f"Ignoring position update: {position_ms}ms (updates disabled)")  # Debug
+            logger.debug("Ignoring position update: %sms (updates disabled)", position_ms)
             return
             
         self.position_ms = position_ms
         
         # Only update slider if user is not currently seeking
         if self.duration_ms > 0 and not self.is_seeking:
-            progress = (position_ms / self.duration_ms) * 1000  # Scale to 0-1000
-            # Temporarily disable our own updates to prevent recursion
-            old_state = self.accept_position_updates
-            self.accept_position_updates = False
-            self.progress_slider.setValue(int(progress))
-            self.accept_position_updates = old_state
-            print(f"Updated slider to position: {position_ms}ms, progress: {progress}")  # Debug
+            progress = position_ms * 1000 // self.duration_ms  # Scale to 0-1000
+            # One slider step spans duration/1000 ms, so most updates of a
+            # long video land on the step the slider already shows
+            if progress != self.progress_slider.value():
+                self.progress_slider.setValue(progress)
+                logger.debug("Updated slider to position: %sms, progress: %s", position_ms, progress)
         elif self.duration_ms == 0:
             # If no duration yet, just update to 0
-            old_state = self.accept_position_updates
-            self.accept_position_updates = False
             self.progress_slider.setValue(0)
-            self.accept_position_updates = old_state
-            print(f"Updated slider to 0 (no duration yet)")  # Debug
+            logger.debug("Updated slider to 0 (no duration yet)")
         
         # Always update time display when not seeking
         if not self.is_seeking:
@@ -574,17 +799,24 @@ class ControlsWidget(QWidget):
     def update_duration(self, duration_ms):
         """Update duration from video player"""
         self.duration_ms = duration_ms
+        self.time_texts = [f"{i // 60:02d}:{i % 60:02d}" for i in range(duration_ms // 1000 + 2)]
         self.update_time_display(self.position_ms, duration_ms)
         
     def update_time_display(self, position_ms, duration_ms):
         """Update time display"""
         current_time = self.format_time(position_ms)
         total_time = self.format_time(duration_ms)
-        self.time_label.setText(f"{current_time} / {total_time}")
+        text = f"{current_time} / {total_time}"
+        if text != self.time_label_text:
+            self.time_label_text = text
+            self.time_label.setText(text)
         
     def format_time(self, ms):
         """Format time in mm:ss format"""
         seconds = ms // 1000
+        if 0 <= seconds < len(self.time_texts):
+            return self.time_texts[seconds]
+            
         minutes = seconds // 60
         seconds = seconds % 60
         return f"{minutes:02d}:{seconds:02d}"
@@ -595,7 +827,7 @@ class ControlsWidget(QWidget):
             start_pos = int((start_time_s / duration_s) * 1000)
             end_pos = int((end_time_s / duration_s) * 1000)
             self.progress_slider.set_gif_markers(start_pos, end_pos, show=True)
-            print(f"Updated GIF markers: start={start_pos}, end={end_pos}")  # Debug
+            logger.debug("Updated GIF markers: start=%s, end=%s", start_pos, end_pos)
         
     def hide_gif_markers(self):
         """Hide GIF markers on timeline"""
@@ -603,7 +835,7 @@ class ControlsWidget(QWidget):
         
     def reset_controls(self):
         """FIXED: Reset controls to initial state with proper position handling"""
-        print("Resetting controls state")  # Debug
+        logger.debug("Resetting controls state")
         self.is_playing = False
         self.play_btn.setText("▶")
         
@@ -613,13 +845,37 @@ class ControlsWidget(QWidget):
         # FIXED: Reset slider to 0
         self.progress_slider.setValue(0)
         
-        self.time_label.setText("00:00 / 00:00")
+        self.time_label_text = "00:00 / 00:00"
+        self.time_label.setText(self.time_label_text)
         self.duration_ms = 0
         self.position_ms = 0
         self.update_export_button(False)  # Disable export button when no video
         self.hide_gif_markers()  # Hide markers when resetting
         
-        print("Controls reset completed - position updates enabled")  # Debug
+        logger.debug("Controls reset completed - position updates enabled")
+
+# Main window dark theme, including the video container, parsed once. Rules
+# are scoped by type or object name so they stay off the video widget
+MAIN_WINDOW_STYLE = """
+    QMainWindow {
+        background-color: #1e1e1e;
+    }
+    QMenuBar {
+        background-color: #2d2d2d;
+        color: white;
+        border: none;
+    }
+    QMenuBar::item {
+        background-color: transparent;
+        padding: 5px 10px;
+    }
+    QMenuBar::item:selected {
+        background-color: #0078d4;
+    }
+    QWidget#videoContainer {
+        background-color: #000000;
+    }
+"""
 
 class MainWindow(QMainWindow):
     """Main application window with keyboard shortcuts and improved timeline"""
@@ -627,7 +883,6 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.video_player = None
-        self.frame_manager = None
         self.current_video_path = None
         
         # GIF export quick settings (for Ctrl+G shortcut)
@@ -671,9 +926,9 @@ class MainWindow(QMainWindow):
                 with open(settings_file, 'r') as f:
                     saved_settings = json.load(f)
                     self.last_gif_settings.update(saved_settings)
-                print(f"Loaded GIF settings: {self.last_gif_settings}")
+                logger.debug("Loaded GIF settings: %s", self.last_gif_settings)
         except Exception as e:
-            print(f"Could not load GIF settings: {e}")
+            logger.warning("Could not load GIF settings: %s", e)
 
     def save_gif_settings(self, dialog):
         """FIXED: Save GIF settings to file"""
@@ -693,9 +948,9 @@ class MainWindow(QMainWindow):
             with open(settings_file, 'w') as f:
                 json.dump(self.last_gif_settings, f, indent=2)
             
-            print(f"Saved GIF settings: {self.last_gif_settings}")
+            logger.debug("Saved GIF settings: %s", self.last_gif_settings)
         except Exception as e:
-            print(f"Could not save GIF settings: {e}")
+            logger.warning("Could not save GIF settings: %s", e)
 
     def save_gif_settings_on_close(self):
         """Save current GIF settings when app closes"""
@@ -709,7 +964,6 @@ class MainWindow(QMainWindow):
     def setup_video_engine(self):
         """Initialize video player engine"""
         self.video_player = VideoPlayerEngine()
-        self.frame_manager = FrameManager()
         
     def setup_ui(self):
         self.setWindowTitle("VideoPlayerPro")
@@ -725,23 +979,7 @@ class MainWindow(QMainWindow):
         self.setFocus()  # Set initial focus
         
         # Apply dark theme
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1e1e1e;
-            }
-            QMenuBar {
-                background-color: #2d2d2d;
-                color: white;
-                border: none;
-            }
-            QMenuBar::item {
-                background-color: transparent;
-                padding: 5px 10px;
-            }
-            QMenuBar::item:selected {
-                background-color: #0078d4;
-            }
-        """)
+        self.setStyleSheet(MAIN_WINDOW_STYLE)
         
         # Central widget
         central_widget = QWidget()
@@ -754,21 +992,28 @@ class MainWindow(QMainWindow):
         
         # Video container (like original)
         self.video_container = QWidget()
-        self.video_container.setStyleSheet("background-color: #000000;")
-        container_layout = QVBoxLayout(self.video_container)
+        # Styled by MAIN_WINDOW_STYLE through this name; an unscoped rule would
+        # cascade into the video widget (which paints every pixel itself) and
+        # the controls overlay
+        self.video_container.setObjectName("videoContainer")
+        # Video and controls share one grid cell, so the layout keeps the
+        # overlay in place on resize without any manual move/resize
+        container_layout = QGridLayout(self.video_container)
         container_layout.setContentsMargins(0, 0, 0, 0)
         
         # Video widget
         self.video_widget = VideoWidget()
-        container_layout.addWidget(self.video_widget)
+        container_layout.addWidget(self.video_widget, 0, 0)
         
         # Connect video widget signals
         self.video_widget.file_dropped.connect(self.on_file_dropped)
-        print("Video widget signals connected")  # Debug
+        self.video_widget.display_size_changed.connect(self.video_player.set_display_size)
+        logger.debug("Video widget signals connected")
         
-        # Controls overlay - positioned as overlay (like original)
+        # Controls overlay - added last so it stacks above the video, anchored
+        # to the bottom at its own height and full width
         self.controls = ControlsWidget()
-        self.controls.setParent(self.video_container)
+        container_layout.addWidget(self.controls, 0, 0, Qt.AlignmentFlag.AlignBottom)
         
         layout.addWidget(self.video_container)
         
@@ -778,9 +1023,6 @@ class MainWindow(QMainWindow):
         # Create status bar for feedback
         self.statusBar().showMessage("Ready - Load a video to get started")
         
-        # Position controls after UI is set up
-        QTimer.singleShot(100, self.position_controls)
-        
         # Add periodic health check for video player
         self.health_check_timer = QTimer()
         self.health_check_timer.timeout.connect(self.check_video_player_health)
@@ -794,18 +1036,6 @@ class MainWindow(QMainWindow):
         y = (screen.height() - size.height()) // 2
         self.move(x, y)
         
-    def position_controls(self):
-        """Position controls at bottom of video container"""
-        if hasattr(self, 'controls') and hasattr(self, 'video_container'):
-            # Get container size
-            container_size = self.video_container.size()
-            
-            # Set controls to full width and height of container
-            self.controls.resize(container_size)
-            
-            # Position at (0,0) - controls will position themselves at bottom
-            self.controls.move(0, 0)
-        
     def setup_menubar(self):
         """Setup modern menu bar"""
         menubar = self.menuBar()
@@ -826,19 +1056,19 @@ class MainWindow(QMainWindow):
         key = event.key()
         modifiers = event.modifiers()
         
-        print(f"Key pressed: {key}, modifiers: {modifiers}, Space key: {Qt.Key.Key_Space}")  # Debug
+        logger.debug("Key pressed: %s, modifiers: %s, Space key: %s", key, modifiers, Qt.Key.Key_Space)
         
         # Throttle rapid key presses to prevent crashes
         if not hasattr(self, 'last_key_time'):
             self.last_key_time = 0
             
         import time
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Space for play/pause (make sure it works regardless of focus)
         if key == Qt.Key.Key_Space:
             event.accept()  # Prevent button activation
-            print("Space key detected, calling space_play_pause")  # Debug
+            logger.debug("Space key detected, calling space_play_pause")
             self.space_play_pause()  # Use dedicated method for space bar
             return
             
@@ -847,38 +1077,38 @@ class MainWindow(QMainWindow):
             event.accept()
             # Moderate throttling for keyboard responsiveness
             if current_time - self.last_key_time > 0.1:  # 100ms minimum between frame steps
-                print("Comma key pressed - previous frame")  # Debug
+                logger.debug("Comma key pressed - previous frame")
                 self.on_frame_step(-1)
                 self.last_key_time = current_time
             else:
-                print("Comma key throttled - too fast")  # Debug
+                logger.debug("Comma key throttled - too fast")
             return
             
         elif key == Qt.Key.Key_Period:  # . for next frame
             event.accept()
             # Moderate throttling for keyboard responsiveness
             if current_time - self.last_key_time > 0.1:  # 100ms minimum between frame steps
-                print("Period key pressed - next frame")  # Debug
+                logger.debug("Period key pressed - next frame")
                 self.on_frame_step(1)
                 self.last_key_time = current_time
             else:
-                print("Period key throttled - too fast")  # Debug
+                logger.debug("Period key throttled - too fast")
             return
             
         # GIF shortcuts
         elif key == Qt.Key.Key_G:
             event.accept()
-            print("G key pressed")  # Debug
+            logger.debug("G key pressed")
             if modifiers & Qt.KeyboardModifier.ControlModifier:
-                print("Ctrl+G - Quick export")  # Debug
+                logger.debug("Ctrl+G - Quick export")
                 # Ctrl+G: Quick export GIF
                 self.quick_export_gif()
             elif modifiers & Qt.KeyboardModifier.ShiftModifier:
-                print("Shift+G - Set end point")  # Debug
+                logger.debug("Shift+G - Set end point")
                 # Shift+G: Set end point
                 self.set_gif_end_point()
             else:
-                print("G - Set start point")  # Debug
+                logger.debug("G - Set start point")
                 # G: Set start point
                 self.set_gif_start_point()
             return
@@ -887,10 +1117,10 @@ class MainWindow(QMainWindow):
         elif key == Qt.Key.Key_U:
             event.accept()
             if modifiers & Qt.KeyboardModifier.ShiftModifier:
-                print("Shift+U key pressed - Clear all GIF markers")  # Debug
+                logger.debug("Shift+U key pressed - Clear all GIF markers")
                 self.clear_all_gif_markers()
             else:
-                print("U key pressed - Undo latest GIF marker")  # Debug
+                logger.debug("U key pressed - Undo latest GIF marker")
                 self.undo_latest_gif_marker()
             return
             
@@ -899,29 +1129,29 @@ class MainWindow(QMainWindow):
         
     def space_play_pause(self):
         """Handle space bar play/pause - works even when no video is playing"""
-        print("Space bar pressed for play/pause")  # Debug
+        logger.debug("Space bar pressed for play/pause")
         
         if not self.current_video_path:
-            print("No video loaded, opening file dialog")  # Debug
+            logger.debug("No video loaded, opening file dialog")
             self.open_file()
             return
             
         # Debug video player state
-        print(f"Video player state - is_playing: {self.video_player.is_playing}, is_paused: {self.video_player.is_paused}")  # Debug
-        print(f"Controls state - is_playing: {self.controls.is_playing}")  # Debug
+        logger.debug("Video player state - is_playing: %s, is_paused: %s", self.video_player.is_playing, self.video_player.is_paused)
+        logger.debug("Controls state - is_playing: %s", self.controls.is_playing)
         
         # Simplified logic - check controls state first, then video player
         if self.controls.is_playing:
-            print("Pausing video (controls show playing)")  # Debug
+            logger.debug("Pausing video (controls show playing)")
             self.video_player.pause()
             self.controls.is_playing = False
             self.controls.play_btn.setText("▶")
         else:
-            print("Playing video (controls show paused)")  # Debug
+            logger.debug("Playing video (controls show paused)")
             
             # FIXED: Ensure timeline updates are enabled before playing
             self.controls.accept_position_updates = True
-            print(f"Position updates enabled: {self.controls.accept_position_updates}")  # Debug
+            logger.debug("Position updates enabled: %s", self.controls.accept_position_updates)
             
             self.video_player.play()
             self.controls.is_playing = True
@@ -935,7 +1165,7 @@ class MainWindow(QMainWindow):
         if self.video_player and self.video_player.video_capture:
             self.gif_start_time = self.video_player.get_current_time_ms() / 1000.0
             self.last_marker_set = 'start'  # Track which marker was set
-            print(f"GIF start point set at: {self.gif_start_time:.1f}s")
+            logger.debug("GIF start point set at: %.1fs", self.gif_start_time)
             
             # Update timeline markers
             duration_s = self.video_player.get_duration_ms() / 1000.0
@@ -949,7 +1179,7 @@ class MainWindow(QMainWindow):
         if self.video_player and self.video_player.video_capture:
             self.gif_end_time = self.video_player.get_current_time_ms() / 1000.0
             self.last_marker_set = 'end'  # Track which marker was set
-            print(f"GIF end point set at: {self.gif_end_time:.1f}s")
+            logger.debug("GIF end point set at: %.1fs", self.gif_end_time)
             
             # Update timeline markers
             duration_s = self.video_player.get_duration_ms() / 1000.0
@@ -957,7 +1187,7 @@ class MainWindow(QMainWindow):
             
             # Show visual feedback
             self.statusBar().showMessage(f"GIF end point set at {self.gif_end_time:.1f}s", 2000)
-            print(f"Current GIF range: {self.gif_start_time:.1f}s to {self.gif_end_time:.1f}s")  # Debug
+            logger.debug("Current GIF range: %.1fs to %.1fs", self.gif_start_time, self.gif_end_time)
             
     def undo_latest_gif_marker(self):
         """Undo the most recently set GIF marker"""
@@ -974,16 +1204,16 @@ class MainWindow(QMainWindow):
         
         if not has_custom_start and not has_custom_end:
             self.statusBar().showMessage("No custom GIF markers to undo", 2000)
-            print(f"No custom markers to undo (start={self.gif_start_time:.1f}s, end={self.gif_end_time:.1f}s, default_end={default_end:.1f}s)")  # Debug
+            logger.debug("No custom markers to undo (start=%.1fs, end=%.1fs, default_end=%.1fs)", self.gif_start_time, self.gif_end_time, default_end)
             return
         
-        print(f"Undoing marker - last_set: {self.last_marker_set}, has_custom_start: {has_custom_start}, has_custom_end: {has_custom_end}")  # Debug
+        logger.debug("Undoing marker - last_set: %s, has_custom_start: %s, has_custom_end: %s", self.last_marker_set, has_custom_start, has_custom_end)
         
         if self.last_marker_set == 'end' and has_custom_end:
             # Reset end marker to default
             self.gif_end_time = default_end
             self.statusBar().showMessage("GIF end marker removed", 2000)
-            print(f"Undid end marker - reset to {self.gif_end_time:.1f}s")  # Debug
+            logger.debug("Undid end marker - reset to %.1fs", self.gif_end_time)
             
             # If we still have a custom start marker, update last_marker_set
             if has_custom_start:
@@ -998,7 +1228,7 @@ class MainWindow(QMainWindow):
             # Reset start marker to default
             self.gif_start_time = 0.0
             self.statusBar().showMessage("GIF start marker removed", 2000)
-            print(f"Undid start marker - reset to {self.gif_start_time:.1f}s")  # Debug
+            logger.debug("Undid start marker - reset to %.1fs", self.gif_start_time)
             
             # If we still have a custom end marker, update last_marker_set
             if has_custom_end:
@@ -1016,14 +1246,14 @@ class MainWindow(QMainWindow):
                 # Reset end marker
                 self.gif_end_time = default_end
                 self.statusBar().showMessage("GIF end marker removed", 2000)
-                print(f"Undid end marker (fallback) - reset to {self.gif_end_time:.1f}s")  # Debug
+                logger.debug("Undid end marker (fallback) - reset to %.1fs", self.gif_end_time)
                 self.last_marker_set = 'start' if has_custom_start else None
                 
             elif has_custom_start:
                 # Reset start marker  
                 self.gif_start_time = 0.0
                 self.statusBar().showMessage("GIF start marker removed", 2000)
-                print(f"Undid start marker (fallback) - reset to {self.gif_start_time:.1f}s")  # Debug
+                logger.debug("Undid start marker (fallback) - reset to %.1fs", self.gif_start_time)
                 self.last_marker_set = None
             
             # Update display
@@ -1035,7 +1265,7 @@ class MainWindow(QMainWindow):
     def clear_all_gif_markers(self):
         """Clear all GIF start and end markers"""
         if self.video_player and self.video_player.video_capture:
-            print("Clearing all GIF markers")  # Debug
+            logger.debug("Clearing all GIF markers")
             
             # Hide markers on timeline
             self.controls.hide_gif_markers()
@@ -1050,7 +1280,7 @@ class MainWindow(QMainWindow):
             
             # Show visual feedback
             self.statusBar().showMessage("All GIF markers cleared", 2000)
-            print(f"All GIF markers cleared - reset to default range: {self.gif_start_time:.1f}s to {self.gif_end_time:.1f}s")  # Debug
+            logger.debug("All GIF markers cleared - reset to default range: %.1fs to %.1fs", self.gif_start_time, self.gif_end_time)
         
     def quick_export_gif(self):
         """Quick export GIF with last used settings"""
@@ -1089,12 +1319,8 @@ class MainWindow(QMainWindow):
         )
         
         # Connect signals for feedback
-        self.quick_gif_exporter.export_finished.connect(
-            lambda path: self.on_quick_export_finished(path)
-        )
-        self.quick_gif_exporter.export_failed.connect(
-            lambda error: self.on_quick_export_failed(error)
-        )
+        self.quick_gif_exporter.export_finished.connect(self.on_quick_export_finished)
+        self.quick_gif_exporter.export_failed.connect(self.on_quick_export_failed)
         
         self.quick_gif_exporter.start()
         self.statusBar().showMessage("Exporting GIF...", 0)
@@ -1109,37 +1335,37 @@ class MainWindow(QMainWindow):
         # Reset marker tracking
         self.last_marker_set = None
         
-        print("GIF markers hidden after export")  # Debug
+        logger.debug("GIF markers hidden after export")
         
         # IMPORTANT: Reset video player state after export to prevent crashes
         try:
             if self.video_player and self.current_video_path:
-                print("Resetting video player after export...")  # Debug
+                logger.debug("Resetting video player after export...")
                 current_position = self.video_player.get_current_time_ms()
                 
                 # Stop current playback
                 self.video_player.stop()
                 
                 # Small delay to ensure cleanup
-                QTimer.singleShot(100, lambda: self.reload_video_after_export(current_position))
+                QTimer.singleShot(100, partial(self.reload_video_after_export, current_position))
                 
         except Exception as e:
-            print(f"Error during post-export cleanup: {e}")  # Debug
+            logger.warning("Error during post-export cleanup: %s", e)
         
     def reload_video_after_export(self, restore_position=0):
         """Reload video after export to ensure clean state"""
         try:
             if self.current_video_path:
-                print(f"Reloading video to restore clean state...")  # Debug
+                logger.debug("Reloading video to restore clean state...")
                 
                 # Stop and cleanup current video player
                 self.video_player.cleanup()
                 
                 # Small delay to ensure cleanup
-                QTimer.singleShot(100, lambda: self.perform_video_reload(restore_position))
+                QTimer.singleShot(100, partial(self.perform_video_reload, restore_position))
                     
         except Exception as e:
-            print(f"Error reloading video after export: {e}")  # Debug
+            logger.warning("Error reloading video after export: %s", e)
             
     def perform_video_reload(self, restore_position=0):
         """Actually perform the video reload"""
@@ -1148,17 +1374,17 @@ class MainWindow(QMainWindow):
             if self.video_player.load_video(self.current_video_path):
                 # Restore position if specified
                 if restore_position > 0:
-                    QTimer.singleShot(300, lambda: self.video_player.seek_to_position(restore_position))
-                print("Video reloaded successfully after export")  # Debug
+                    QTimer.singleShot(300, partial(self.video_player.seek_to_position, restore_position))
+                logger.debug("Video reloaded successfully after export")
                 
                 # Ensure controls are in correct state
                 self.controls.is_playing = False
                 self.controls.play_btn.setText("▶")
             else:
-                print("Failed to reload video after export")  # Debug
+                logger.warning("Failed to reload video after export")
                 
         except Exception as e:
-            print(f"Error performing video reload: {e}")  # Debug
+            logger.warning("Error performing video reload: %s", e)
         
     def on_quick_export_failed(self, error):
         """Handle quick export failure"""
@@ -1167,11 +1393,15 @@ class MainWindow(QMainWindow):
     def connect_signals(self):
         """Connect all signals"""
         # Video player signals
-        self.video_player.frame_ready.connect(self.on_frame_ready)
+        # Frames come from the playback thread; queue them explicitly so the
+        # GUI thread only ever stores the finished QImage
+        self.video_player.frame_ready.connect(self.on_frame_ready, Qt.ConnectionType.QueuedConnection)
         self.video_player.position_changed.connect(self.controls.update_position)
         self.video_player.duration_changed.connect(self.controls.update_duration)
         self.video_player.playback_finished.connect(self.on_playback_finished)
         self.video_player.error_occurred.connect(self.on_error)
+        self.video_player.seek_completed.connect(self.controls.on_seek_completed)
+        self.video_player.playing_changed.connect(self.video_widget.set_playing)
         
         # Controls signals
         self.controls.play_pause_clicked.connect(self.toggle_play_pause)
@@ -1182,40 +1412,22 @@ class MainWindow(QMainWindow):
         self.controls.volume_changed.connect(self.video_player.set_volume)  # Connect volume control
         
         # Debug: Print when signals are connected
-        print("All signals connected successfully")
+        logger.debug("All signals connected successfully")
         
-    def on_frame_ready(self, cv_frame):
-        """Handle new frame from video player with error protection"""
-        try:
-            if cv_frame is not None and cv_frame.size > 0:
-                pixmap = self.frame_manager.convert_cv_to_qt(cv_frame)
-                if pixmap and not pixmap.isNull():
-                    self.video_widget.display_frame(pixmap)
-            else:
-                print("Received invalid frame")  # Debug
-        except Exception as e:
-            print(f"Error handling frame: {e}")  # Debug
-            # Don't crash the app, just log the error
+    def on_frame_ready(self, image):
+        """Show a decoded frame - already an RGB32 QImage, converted on the decode thread"""
+        if not image.isNull():
+            self.video_widget.display_frame(image)
 
     def on_playback_finished(self):
         """FIXED: Handle playback finished - properly reset state and ensure timeline works"""
-        print("Video playback finished - resetting state")  # Debug
+        logger.debug("Video playback finished - resetting state")
         
-        # Stop the video player completely
+        # Stop the video player completely - stop() rewinds to frame 0 and
+        # re-shows the first frame kept from load, so no seek or decode here;
+        # the next read repositions the capture lazily
         if self.video_player:
             self.video_player.stop()
-            
-            # Reset to beginning and read first frame
-            if self.video_player.video_capture and self.video_player.video_capture.isOpened():
-                self.video_player.video_capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                self.video_player.current_frame = 0
-                
-                # Load and display first frame
-                ret, frame = self.video_player.video_capture.read()
-                if ret:
-                    self.on_frame_ready(frame)
-                    # Reset position for next read
-                    self.video_player.video_capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
         
         # FIXED: Reset controls state with proper timeline handling
         self.controls.is_playing = False
@@ -1227,7 +1439,7 @@ class MainWindow(QMainWindow):
         # FIXED: Reset timeline to 0 properly
         self.controls.progress_slider.setValue(0)
         self.controls.position_ms = 0
-        self.controls.time_label.setText("00:00 / 00:00")
+        self.controls.update_time_display(0, self.controls.duration_ms)
         
         # FIXED: Manually emit position 0 to ensure timeline is at start
         self.video_player.position_changed.emit(0)
@@ -1236,7 +1448,7 @@ class MainWindow(QMainWindow):
         self.frame_step_count = 0
         self.frame_step_lockout = False
         
-        print("Video end reset completed - timeline should be at start")  # Debug
+        logger.debug("Video end reset completed - timeline should be at start")
         
     def on_error(self, error_message):
         """Handle video player errors"""
@@ -1244,26 +1456,26 @@ class MainWindow(QMainWindow):
 
     def on_frame_step(self, direction):
         """FIXED: Handle frame stepping with aggressive crash protection"""
-        print(f"Frame step requested: {direction}")  # Debug
+        logger.debug("Frame step requested: %s", direction)
         
         # Check if video is loaded and healthy
         if not self.video_player or not self.video_player.video_capture:
-            print("No video loaded for frame stepping")  # Debug
+            logger.debug("No video loaded for frame stepping")
             return
             
         try:
             # Check if video capture is still valid
             if not self.video_player.video_capture.isOpened():
-                print("Video capture not opened - attempting recovery")  # Debug
+                logger.debug("Video capture not opened - attempting recovery")
                 self.perform_video_reload()
                 return
         except Exception as e:
-            print(f"Error checking video capture state: {e}")  # Debug
+            logger.warning("Error checking video capture state: %s", e)
             return
         
         # FIXED: Aggressive crash protection with frame step counting
         import time
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Initialize counters if needed
         if not hasattr(self, 'last_frame_step_time'):
@@ -1275,12 +1487,12 @@ class MainWindow(QMainWindow):
         # Check if we're in lockout mode
         if self.frame_step_lockout:
             if current_time - self.frame_step_window_start > 3.0:  # 3 second lockout
-                print("Frame step lockout expired - resetting")  # Debug
+                logger.debug("Frame step lockout expired - resetting")
                 self.frame_step_lockout = False
                 self.frame_step_count = 0
                 self.frame_step_window_start = current_time
             else:
-                print("Frame step in lockout mode - ignoring")  # Debug
+                logger.debug("Frame step in lockout mode - ignoring")
                 return
         
         # Reset counter if enough time has passed since first step
@@ -1290,16 +1502,16 @@ class MainWindow(QMainWindow):
             
         # Basic throttling - 200ms minimum between steps (more aggressive than before)
         if current_time - self.last_frame_step_time < 0.2:
-            print("Frame step throttled - too fast")  # Debug
+            logger.debug("Frame step throttled - too fast")
             return
             
         # Count frame steps in current window
         self.frame_step_count += 1
-        print(f"Frame step count: {self.frame_step_count} in window")  # Debug
+        logger.debug("Frame step count: %s in window", self.frame_step_count)
         
         # If too many frame steps, enter lockout mode
         if self.frame_step_count >= 6:  # More than 5 steps in 2 seconds
-            print("TOO MANY FRAME STEPS - ENTERING LOCKOUT MODE")  # Debug
+            logger.debug("TOO MANY FRAME STEPS - ENTERING LOCKOUT MODE")
             self.frame_step_lockout = True
             self.statusBar().showMessage("Frame stepping locked - too many rapid steps (wait 3 seconds)", 3000)
             return
@@ -1308,34 +1520,34 @@ class MainWindow(QMainWindow):
         
         try:
             # FIXED: Add small delay before frame step to let FFmpeg stabilize
-            QTimer.singleShot(50, lambda: self.execute_safe_frame_step(direction))
+            QTimer.singleShot(50, partial(self.execute_safe_frame_step, direction))
             
         except Exception as e:
-            print(f"Error during frame stepping: {e}")  # Debug
+            logger.warning("Error during frame stepping: %s", e)
             
     def execute_safe_frame_step(self, direction):
         """FIXED: Execute frame step with maximum safety"""
         try:
             # Double-check video is still valid
             if not self.video_player or not self.video_player.video_capture:
-                print("Video no longer valid during frame step")  # Debug
+                logger.debug("Video no longer valid during frame step")
                 return
                 
             if not self.video_player.video_capture.isOpened():
-                print("Video capture closed during frame step")  # Debug
+                logger.debug("Video capture closed during frame step")
                 return
             
             # Pause if playing to prevent conflicts
             was_playing = self.video_player.is_playing and not self.video_player.is_paused
             if was_playing:
                 self.video_player.pause()
-                print("Paused for safe frame stepping")  # Debug
+                logger.debug("Paused for safe frame stepping")
                 
             # Add extra delay for FFmpeg to settle
-            QTimer.singleShot(25, lambda: self.perform_actual_frame_step(direction))
+            QTimer.singleShot(25, partial(self.perform_actual_frame_step, direction))
             
         except Exception as e:
-            print(f"Error in safe frame step execution: {e}")  # Debug
+            logger.warning("Error in safe frame step execution: %s", e)
             
     def perform_actual_frame_step(self, direction):
         """FIXED: Perform the actual frame step with ultimate protection"""
@@ -1350,18 +1562,18 @@ class MainWindow(QMainWindow):
             elif direction == -1:
                 self.video_player.previous_frame()
                 
-            print("Safe frame step completed")  # Debug
+            logger.debug("Safe frame step completed")
             
         except Exception as e:
-            print(f"CRITICAL ERROR in frame step - entering emergency lockout: {e}")  # Debug
+            logger.warning("CRITICAL ERROR in frame step - entering emergency lockout: %s", e)
             # Emergency lockout - disable frame stepping for longer
             self.frame_step_lockout = True
-            self.frame_step_window_start = time.time()
+            self.frame_step_window_start = time.monotonic()
             self.statusBar().showMessage("Frame stepping disabled due to error - please reload video", 5000)
         
     def on_file_dropped(self, file_path):
         """Handle file dropped on video widget"""
-        print(f"File dropped signal received: {file_path}")  # Debug
+        logger.debug("File dropped signal received: %s", file_path)
         if file_path:  # File was dropped
             self.load_video(file_path)
         else:  # Video widget was clicked
@@ -1369,7 +1581,7 @@ class MainWindow(QMainWindow):
 
     def open_gif_export_dialog(self):
         """FIXED: Open GIF export dialog with saved settings"""
-        print("Opening GIF export dialog")  # Debug
+        logger.debug("Opening GIF export dialog")
         
         if not self.current_video_path:
             QMessageBox.warning(self, "No Video", "Please load a video first.")
@@ -1383,7 +1595,7 @@ class MainWindow(QMainWindow):
         duration_ms = self.video_player.get_duration_ms()
         current_position_ms = self.video_player.get_current_time_ms()
         
-        print(f"Opening export dialog with GIF range: {self.gif_start_time:.1f}s to {self.gif_end_time:.1f}s")  # Debug
+        logger.debug("Opening export dialog with GIF range: %.1fs to %.1fs", self.gif_start_time, self.gif_end_time)
         
         # Open export dialog with saved settings
         dialog = ModifiedGifExportDialog(
@@ -1404,7 +1616,7 @@ class MainWindow(QMainWindow):
         
     def load_video(self, video_path):
         """Load a video file with robust error handling"""
-        print(f"Loading video: {video_path}")  # Debug
+        logger.debug("Loading video: %s", video_path)
         
         try:
             # Stop health check during loading
@@ -1418,7 +1630,7 @@ class MainWindow(QMainWindow):
             if self.video_player.load_video(video_path):
                 self.current_video_path = video_path
                 self.setWindowTitle(f"VideoPlayerPro - {os.path.basename(video_path)}")
-                print(f"Video loaded successfully: {video_path}")
+                logger.debug("Video loaded successfully: %s", video_path)
                 
                 # Enable export button
                 self.controls.update_export_button(True)
@@ -1446,30 +1658,24 @@ class MainWindow(QMainWindow):
                 
                 # Show video info
                 info = self.video_player.get_video_info()
-                print(f"Video Info: {info}")
+                logger.debug("Video Info: %s", info)
                 
                 # Restart health check
                 if hasattr(self, 'health_check_timer'):
                     self.health_check_timer.start(5000)
                     
             else:
-                print(f"Failed to load video: {video_path}")
+                logger.warning("Failed to load video: %s", video_path)
                 self.controls.update_export_button(False)
                 if hasattr(self, 'health_check_timer'):
                     self.health_check_timer.start(5000)
                     
         except Exception as e:
-            print(f"Error loading video: {e}")  # Debug
+            logger.warning("Error loading video: %s", e)
             self.controls.update_export_button(False)
             if hasattr(self, 'health_check_timer'):
                 self.health_check_timer.start(5000)
         
-    def resizeEvent(self, event):
-        """Handle window resize"""
-        super().resizeEvent(event)
-        # Reposition controls when window is resized
-        QTimer.singleShot(10, self.position_controls)
-        
     def open_file(self):
         """Open video file dialog"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -1486,41 +1692,41 @@ class MainWindow(QMainWindow):
         """FIXED: Test if timeline updates are working after playback starts"""
         try:
             current_pos = self.video_player.get_current_time_ms()
-            print(f"Timeline test - Video position: {current_pos}ms")  # Debug
-            print(f"Timeline test - Controls position: {self.controls.position_ms}ms")  # Debug
-            print(f"Timeline test - Slider value: {self.controls.progress_slider.value()}")  # Debug
-            print(f"Timeline test - Accept updates: {self.controls.accept_position_updates}")  # Debug
+            logger.debug("Timeline test - Video position: %sms", current_pos)
+            logger.debug("Timeline test - Controls position: %sms", self.controls.position_ms)
+            logger.debug("Timeline test - Slider value: %s", self.controls.progress_slider.value())
+            logger.debug("Timeline test - Accept updates: %s", self.controls.accept_position_updates)
             
             # If position is greater than 0 but slider is still at 0, there's an issue
             if current_pos > 100 and self.controls.progress_slider.value() == 0:
-                print("WARNING: Timeline not updating - forcing position update")  # Debug
+                logger.warning("Timeline not updating - forcing position update")
                 self.controls.update_position(current_pos)
                 
         except Exception as e:
-            print(f"Error in timeline test: {e}")  # Debug
+            logger.warning("Error in timeline test: %s", e)
             
     def toggle_play_pause(self):
         """Toggle between play and pause - synced with space bar"""
-        print("Toggle play/pause called (from button)")  # Debug
+        logger.debug("Toggle play/pause called (from button)")
         
         if not self.current_video_path:
             self.open_file()
             return
             
         # Use same logic as space_play_pause for consistency
-        print(f"Current controls state: {self.controls.is_playing}")  # Debug
+        logger.debug("Current controls state: %s", self.controls.is_playing)
         
         if self.controls.is_playing:
-            print("Pausing video (button method)")  # Debug
+            logger.debug("Pausing video (button method)")
             self.video_player.pause()
             self.controls.is_playing = False
             self.controls.play_btn.setText("▶")
         else:
-            print("Playing video (button method)")  # Debug
+            logger.debug("Playing video (button method)")
             
             # FIXED: Ensure timeline updates are enabled before playing
             self.controls.accept_position_updates = True
-            print(f"Position updates enabled: {self.controls.accept_position_updates}")  # Debug
+            logger.debug("Position updates enabled: %s", self.controls.accept_position_updates)
             
             self.video_player.play()
             self.controls.is_playing = True
@@ -1548,7 +1754,7 @@ class MainWindow(QMainWindow):
             if self.video_player and self.current_video_path:
                 # Check if video capture is still valid
                 if not self.video_player.video_capture or not self.video_player.video_capture.isOpened():
-                    print("Video player health check: Video capture is not opened")  # Debug
+                    logger.debug("Video player health check: Video capture is not opened")
                     # Try to recover by reloading
                     if hasattr(self, 'last_known_position'):
                         self.perform_video_reload(self.last_known_position)
@@ -1563,14 +1769,14 @@ class MainWindow(QMainWindow):
                         
         except KeyboardInterrupt:
             # FIXED: Handle keyboard interrupt gracefully - don't crash
-            print("Health check interrupted - continuing normally")
+            logger.debug("Health check interrupted - continuing normally")
             pass
         except Exception as e:
-            print(f"Error in health check: {e}")  # Debug
+            logger.warning("Error in health check: %s", e)
     
     def focusInEvent(self, event):
         """Handle focus events"""
-        print("Main window gained focus")  # Debug
+        logger.debug("Main window gained focus")
         super().focusInEvent(event)
 
     def closeEvent(self, event):
@@ -1591,7 +1797,7 @@ class MainWindow(QMainWindow):
             event.accept()
             
         except Exception as e:
-            print(f"Error during close: {e}")
+            logger.warning("Error during close: %s", e)
             event.accept()  # Close anyway
 
 class ModifiedGifExportDialog(GifExportDialog):
@@ -1607,7 +1813,7 @@ class ModifiedGifExportDialog(GifExportDialog):
         self.custom_end_time = gif_end_time
         self.saved_settings = saved_settings or {}
         
-        print(f"ModifiedGifExportDialog init: start={gif_start_time}, end={gif_end_time}")  # Debug
+        logger.debug("ModifiedGifExportDialog init: start=%s, end=%s", gif_start_time, gif_end_time)
         
         # Call parent constructor but we'll override the times after
         super().__init__(parent, video_path, duration_ms, current_position_ms)
@@ -1616,16 +1822,16 @@ class ModifiedGifExportDialog(GifExportDialog):
         self.start_time = self.custom_start_time
         self.end_time = self.custom_end_time
         
-        print(f"Setting dialog times: start={self.start_time}, end={self.end_time}")  # Debug
+        logger.debug("Setting dialog times: start=%s, end=%s", self.start_time, self.end_time)
         
         # FIXED: Apply saved settings if available
         self.apply_saved_settings()
         
-        # Update sliders to reflect these times (convert to 0.1 second units)
-        self.start_slider.setValue(int(self.start_time * 10))
-        self.end_slider.setValue(int(self.end_time * 10))
+        # Update sliders to reflect these times (convert to slider ticks)
+        self.start_slider.setValue(self.seconds_to_tick(self.start_time))
+        self.end_slider.setValue(self.seconds_to_tick(self.end_time))
         
-        print(f"Slider values set: start={int(self.start_time * 10)}, end={int(self.end_time * 10)}")  # Debug
+        logger.debug("Slider values set: start=%s, end=%s", self.start_slider.value(), self.end_slider.value())
         
         # Update labels and preview
         self.update_time_labels()
@@ -1658,10 +1864,10 @@ class ModifiedGifExportDialog(GifExportDialog):
             if index >= 0:
                 self.quality_combo.setCurrentIndex(index)
                 
-            print(f"Applied saved settings: fps={fps}, size={size_option}, quality={quality_option}")
+            logger.debug("Applied saved settings: fps=%s, size=%s, quality=%s", fps, size_option, quality_option)
             
         except Exception as e:
-            print(f"Error applying saved settings: {e}")
+            logger.warning("Error applying saved settings: %s", e)
     
     def on_export_finished_hide_markers(self, output_path):
         """Handle export completion and hide markers"""
@@ -1675,33 +1881,33 @@ class ModifiedGifExportDialog(GifExportDialog):
             # Reset marker tracking
             self.parent_window.last_marker_set = None
             
-            print("GIF markers hidden after dialog export")  # Debug
+            logger.debug("GIF markers hidden after dialog export")
             
         # Also trigger video reload to prevent crashes
         if self.parent_window:
-            QTimer.singleShot(200, lambda: self.parent_window.reload_video_after_export())
+            QTimer.singleShot(200, self.parent_window.reload_video_after_export)
     
     def jump_to_start(self):
         """Jump main player to start time - using the actual start time"""
         if self.parent_window and hasattr(self.parent_window, 'video_player'):
             start_ms = int(self.start_time * 1000)
-            print(f"Jump to start: {self.start_time}s = {start_ms}ms")  # Debug
+            logger.debug("Jump to start: %ss = %sms", self.start_time, start_ms)
             try:
                 self.parent_window.video_player.seek_to_position(start_ms)
-                print("Jump to start completed")  # Debug
+                logger.debug("Jump to start completed")
             except Exception as e:
-                print(f"Error jumping to start: {e}")  # Debug
+                logger.warning("Error jumping to start: %s", e)
             
     def jump_to_end(self):
         """Jump main player to end time - using the actual end time"""
         if self.parent_window and hasattr(self.parent_window, 'video_player'):
             end_ms = int(self.end_time * 1000)
-            print(f"Jump to end: {self.end_time}s = {end_ms}ms")  # Debug
+            logger.debug("Jump to end: %ss = %sms", self.end_time, end_ms)
             try:
                 self.parent_window.video_player.seek_to_position(end_ms)
-                print("Jump to end completed")  # Debug
+                logger.debug("Jump to end completed")
             except Exception as e:
-                print(f"Error jumping to end: {e}")  # Debug
+                logger.warning("Error jumping to end: %s", e)
 
 # Test the main window
 if __name__ == "__main__":